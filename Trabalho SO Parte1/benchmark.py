@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+"""
+benchmark.py - Suíte de benchmarks (micro e macro) do núcleo concorrente
+
+Roda sem janela (plataforma Qt "offscreen"), grava os resultados em JSON e
+compara com um baseline salvo para detectar regressões de performance.
+
+    python benchmark.py                          # mede e compara com o baseline
+    python benchmark.py --atualizar-baseline     # mede e grava um novo baseline
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import statistics
+
+# Precisa ser definido antes de qualquer import do Qt
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import __version__ as PYSIDE_VERSION
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtWidgets import QApplication
+
+from worker import Worker, WorkerSignals, TaskManager
+from cozinha import Cozinha, aguardar_finalizacao, executar_headless, percentil
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PADRAO = os.path.join(DIRETORIO, "benchmark_baseline.json")
+SAIDA_PADRAO = os.path.join(DIRETORIO, "benchmark_resultado.json")
+
+# Tempo máximo de espera pela primeira pintura da janela (s)
+PRAZO_PINTURA = 10.0
+
+# Abre a janela num processo novo, com o relógio zerado antes de qualquer
+# import pesado, e devolve os tempos de inicialização em JSON
+_SCRIPT_ABERTURA = """
+import time
+inicio = time.perf_counter()
+import sys, json
+sys.path.insert(0, sys.argv[1])
+import main
+app = main.QApplication(sys.argv[:1])
+janela = main.CozinhaSimulator(inicio_processo=inicio)
+janela.show()
+prazo = time.perf_counter() + float(sys.argv[2])
+while "primeira_pintura" not in janela.tempos_inicializacao and time.perf_counter() < prazo:
+    app.processEvents()
+print(json.dumps(janela.tempos_inicializacao))
+"""
+
+class _Receptor(QObject):
+    """Alvo mínimo para medir o custo de um emit com slot conectado"""
+    sinal = Signal(int)
+
+# ==================== FERRAMENTAS DE MEDIÇÃO ====================
+
+def _medir(funcao, repeticoes, rodadas=7):
+    """Tempo por chamada (µs), usando a melhor de várias rodadas"""
+    melhores = []
+    for _ in range(rodadas):
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            funcao()
+        melhores.append((time.perf_counter() - inicio) / repeticoes * 1e6)
+    return min(melhores)
+
+def _calibrar():
+    """
+    Laço de Python puro com custo fixo (µs). A razão entre a calibração atual e
+    a do baseline desconta a variação de velocidade da própria máquina.
+    """
+    def _laco():
+        total = 0
+        for i in range(2000):
+            total += i * i % 7
+        return total
+    return _medir(_laco, 200)
+
+UNIDADES_DE_TEMPO = ("us", "ms")
+
+def _metrica(valor, unidade, melhor="menor", tolerancia=None, bloqueia=True):
+    """
+    `tolerancia` substitui a tolerância global para métricas mais ruidosas;
+    métricas com `bloqueia=False` (caudas como p95) só aparecem no relatório.
+    """
+    return {"valor": valor, "unidade": unidade, "melhor": melhor,
+            "tolerancia": tolerancia, "bloqueia": bloqueia}
+
+def _combinar_execucoes(execucoes):
+    """
+    Combina execuções completas da suíte: tempos ficam com o mínimo (o ruído
+    da máquina só soma), taxas como throughput ficam com a mediana
+    """
+    combinados = {}
+    for nome, metrica in execucoes[0].items():
+        amostras = [execucao[nome]["valor"] for execucao in execucoes]
+        valor = min(amostras) if metrica["melhor"] == "menor" else statistics.median(amostras)
+        combinados[nome] = dict(metrica, valor=valor, amostras=amostras)
+    return combinados
+
+# ==================== MICRO-BENCHMARKS ====================
+
+def bench_criacao(repeticoes):
+    """Custo de criar WorkerSignals e Worker"""
+    return {
+        "worker_signals_criacao": _metrica(_medir(WorkerSignals, repeticoes), "us"),
+        "worker_criacao": _metrica(
+            _medir(lambda: Worker(0, "Mesa 01: 🍕 Pizza Margherita"), repeticoes), "us"
+        ),
+    }
+
+def bench_emissao(repeticoes):
+    """Custo de emitir um sinal sem conexões e com um slot Python"""
+    sinais = WorkerSignals()
+    receptor = _Receptor()
+    receptor.sinal.connect(lambda valor: None)
+
+    return {
+        "emit_sem_conexao": _metrica(_medir(lambda: sinais.progresso.emit(50), repeticoes), "us"),
+        "emit_com_slot": _metrica(_medir(lambda: receptor.sinal.emit(50), repeticoes), "us"),
+    }
+
+def bench_geracao_tarefas(tamanhos, repeticoes):
+    """Velocidade de TaskManager.gerar_lista_tarefas para vários tamanhos"""
+    resultados = {}
+    for tamanho in tamanhos:
+        # Mesmo volume de pedidos gerados por rodada, seja qual for o tamanho da lista
+        vezes = max(50, repeticoes * 20 // tamanho)
+        tempo = _medir(lambda: TaskManager.gerar_lista_tarefas(tamanho), vezes)
+        resultados[f"gerar_lista_tarefas_{tamanho}"] = _metrica(tempo, "us")
+    return resultados
+
+def _medir_despacho(cozinha, num_despachos, antes_de_despachar=None):
+    """Latência de cada chamada a _despachar_proxima_tarefa (µs)"""
+    cozinha.carregar_tarefas(TaskManager.gerar_lista_tarefas(num_despachos))
+    if antes_de_despachar is not None:
+        antes_de_despachar()
+
+    latencias = []
+    cozinha.timer_inicio = time.time()
+    for i in range(num_despachos):
+        inicio = time.perf_counter()
+        cozinha._despachar_proxima_tarefa(i % cozinha.num_cozinheiros)
+        latencias.append((time.perf_counter() - inicio) * 1e6)
+
+    # As conclusões só são processadas aqui, depois de todas as medições
+    aguardar_finalizacao(cozinha)
+    cozinha.thread_pool.waitForDone()
+    return latencias
+
+def bench_despacho(num_despachos):
+    """Latência de despacho no núcleo e com a janela conectada"""
+    from main import CozinhaSimulator
+
+    nucleo = Cozinha(3, tempo_base=0, variacao=(0, 0), passos=1)
+    latencias_nucleo = _medir_despacho(nucleo, num_despachos)
+
+    janela = CozinhaSimulator()
+    janela.concluir_inicializacao()
+    com_ui = Cozinha(len(janela.cozinheiros), tempo_base=0, variacao=(0, 0), passos=1)
+    janela._conectar_cozinha(com_ui, "BENCHMARK")
+
+    def _preencher_lista():
+        janela.timer_inicio = time.time()
+        janela.lista_tarefas.clear()
+        janela.lista_tarefas.addItems(list(com_ui.fila_de_tarefas))
+
+    latencias_ui = _medir_despacho(com_ui, num_despachos, _preencher_lista)
+    janela.close()
+
+    return {
+        "despacho_nucleo_mediana": _metrica(statistics.median(latencias_nucleo), "us"),
+        "despacho_nucleo_p95": _metrica(percentil(latencias_nucleo, 95), "us", bloqueia=False),
+        "despacho_ui_mediana": _metrica(statistics.median(latencias_ui), "us", tolerancia=0.40),
+        "despacho_ui_p95": _metrica(percentil(latencias_ui, 95), "us", bloqueia=False),
+    }
+
+def _abrir_em_processo_novo():
+    """Tempos de inicialização de uma janela aberta num interpretador novo"""
+    saida = subprocess.run(
+        [sys.executable, "-c", _SCRIPT_ABERTURA, DIRETORIO, str(PRAZO_PINTURA)],
+        capture_output=True, text=True, timeout=PRAZO_PINTURA + 30, check=True,
+    ).stdout
+    tempos = json.loads(saida.strip().splitlines()[-1])
+    if "primeira_pintura_processo" not in tempos:
+        raise RuntimeError(f"a janela não foi pintada em {PRAZO_PINTURA:.0f} s (processo novo)")
+    return tempos
+
+def bench_inicializacao(repeticoes):
+    """Tempo até a primeira pintura da janela e custo visual de cada pedido num cozinheiro"""
+    from main import CozinhaSimulator
+
+    # Do início do processo (imports incluídos) até a primeira pintura
+    tempos_processo = [_abrir_em_processo_novo()["primeira_pintura_processo"]
+                       for _ in range(repeticoes)]
+
+    app = QApplication.instance()
+    tempos_janela = []
+    tempos_completa = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        prazo = inicio + PRAZO_PINTURA
+        janela = CozinhaSimulator()
+        janela.show()
+        while not janela._inicializacao_concluida:
+            if time.perf_counter() > prazo:
+                raise RuntimeError(f"a janela não foi pintada em {PRAZO_PINTURA:.0f} s")
+            app.processEvents()
+        tempos_completa.append((time.perf_counter() - inicio) * 1000)
+        tempos_janela.append(janela.tempos_inicializacao["primeira_pintura"])
+        janela.close()
+        janela.deleteLater()
+        app.processEvents()
+
+    janela = CozinhaSimulator()
+    janela.show()
+    app.processEvents()
+    painel = janela.cozinheiros[0]
+
+    def _ciclo_do_pedido():
+        # Sequência real da interface: pedido começa, termina e o painel volta a aguardar
+        painel.iniciar_tarefa("Mesa 01: 🍕 Pizza Margherita")
+        painel.tarefa_concluida(1.0)
+        painel.resetar()
+
+    restyle_ciclo = _medir(_ciclo_do_pedido, 200)
+    janela.close()
+
+    return {
+        "inicializacao_processo": _metrica(min(tempos_processo), "ms"),
+        "inicializacao_janela": _metrica(min(tempos_janela), "ms"),
+        "inicializacao_completa": _metrica(min(tempos_completa), "ms"),
+        "restyle_cozinheiro_ciclo": _metrica(restyle_ciclo, "us"),
+    }
+
+# ==================== MACRO-BENCHMARK ====================
+
+def bench_escalabilidade(max_cozinheiros, num_pedidos, tempo_tarefa):
+    """Throughput ponta a ponta de 1 até N cozinheiros com a mesma carga"""
+    resultados = {}
+    tarefas = TaskManager.gerar_lista_tarefas(num_pedidos)
+    throughput_1 = None
+
+    for num_cozinheiros in range(1, max_cozinheiros + 1):
+        execucao = executar_headless(num_cozinheiros, tarefas, tempo_base=tempo_tarefa,
+                                     variacao=(0, 0), passos=10)
+        throughput = execucao["throughput"]
+        if throughput_1 is None:
+            throughput_1 = throughput
+        speedup = throughput / throughput_1 if throughput_1 else 0
+
+        resultados[f"throughput_{num_cozinheiros}_cozinheiros"] = _metrica(
+            throughput, "pedidos/s", "maior"
+        )
+        resultados[f"eficiencia_{num_cozinheiros}_cozinheiros"] = _metrica(
+            speedup / num_cozinheiros, "fração", "maior"
+        )
+    return resultados
+
+# ==================== BASELINE ====================
+
+def comparar_com_baseline(resultados, baseline, tolerancia, fator_maquina=1.0):
+    """
+    Retorna (linhas do relatório, lista de regressões).
+    Métricas de tempo do baseline são escaladas por `fator_maquina`
+    (calibração atual / calibração do baseline).
+    """
+    linhas = []
+    regressoes = []
+
+    for nome, atual in resultados.items():
+        base = baseline.get(nome)
+        if base is None or not base["valor"]:
+            linhas.append(f"  {nome:<32} {atual['valor']:>12.2f} {atual['unidade']:<10} (novo)")
+            continue
+
+        referencia = base["valor"]
+        if atual["unidade"] in UNIDADES_DE_TEMPO:
+            referencia *= fator_maquina
+        limite = atual.get("tolerancia") or tolerancia
+        variacao = (atual["valor"] - referencia) / referencia
+        piorou = variacao > limite if atual["melhor"] == "menor" else variacao < -limite
+        if not atual.get("bloqueia", True):
+            marca = "ℹ️ informativo"
+        elif piorou:
+            marca = "❌ REGRESSÃO"
+            regressoes.append(nome)
+        else:
+            marca = "✅"
+        linhas.append(
+            f"  {nome:<32} {atual['valor']:>12.2f} {atual['unidade']:<10} "
+            f"base {referencia:>10.2f}  {variacao:+7.1%} (±{limite:.0%})  {marca}"
+        )
+
+    return linhas, regressoes
+
+def _carregar_json(caminho):
+    with open(caminho, encoding="utf-8") as arquivo:
+        return json.load(arquivo)
+
+def _salvar_json(caminho, dados):
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(dados, arquivo, indent=2, ensure_ascii=False)
+
+def _comparar(resultados, baseline, tolerancia):
+    fator_maquina = 1.0
+    if "calibracao" in baseline:
+        fator_maquina = resultados["calibracao"]["valor"] / baseline["calibracao"]["valor"]
+    linhas, regressoes = comparar_com_baseline(resultados, baseline, tolerancia, fator_maquina)
+    return linhas, regressoes, fator_maquina
+
+def _salvar_resultados(caminho, resultados):
+    _salvar_json(caminho, {
+        "ambiente": {
+            "python": platform.python_version(),
+            "pyside6": PYSIDE_VERSION,
+            "plataforma": platform.platform(),
+            "data": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "resultados": resultados,
+    })
+    print(f"📄 Resultados gravados em {caminho}")
+
+# ==================== PROGRAMA PRINCIPAL ====================
+
+def executar_suite(args):
+    """Roda todos os benchmarks e devolve o dicionário de resultados"""
+    resultados = {"calibracao": _metrica(_calibrar(), "us", bloqueia=False)}
+    resultados.update(bench_criacao(args.repeticoes))
+    resultados.update(bench_emissao(args.repeticoes))
+    resultados.update(bench_geracao_tarefas((10, 50, 1000), args.repeticoes))
+    resultados.update(bench_despacho(args.despachos))
+    resultados.update(bench_inicializacao(args.inicializacoes))
+    if not args.sem_macro:
+        resultados.update(bench_escalabilidade(args.max_cozinheiros, args.pedidos, args.tempo_tarefa))
+    return resultados
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks do núcleo concorrente")
+    parser.add_argument("--saida", default=SAIDA_PADRAO, help="arquivo JSON de resultados")
+    parser.add_argument("--baseline", default=BASELINE_PADRAO, help="arquivo JSON do baseline")
+    parser.add_argument("--atualizar-baseline", action="store_true",
+                        help="grava os resultados atuais como novo baseline")
+    parser.add_argument("--sem-baseline-ok", action="store_true",
+                        help="sem baseline, só mostra os resultados e sai com sucesso "
+                             "(por padrão a falta do baseline é um erro)")
+    parser.add_argument("--tolerancia", type=float, default=0.30,
+                        help="variação relativa aceita antes de acusar regressão "
+                             "(métricas ruidosas usam uma faixa própria)")
+    parser.add_argument("--execucoes", type=int, default=5,
+                        help="execuções completas da suíte a combinar antes de comparar")
+    parser.add_argument("--confirmacoes", type=int, default=3,
+                        help="execuções extras para confirmar uma regressão antes de acusá-la")
+    parser.add_argument("--repeticoes", type=int, default=2000)
+    parser.add_argument("--despachos", type=int, default=200)
+    parser.add_argument("--inicializacoes", type=int, default=10,
+                        help="janelas criadas para medir a inicialização")
+    parser.add_argument("--max-cozinheiros", type=int, default=6)
+    parser.add_argument("--pedidos", type=int, default=24)
+    parser.add_argument("--tempo-tarefa", type=float, default=0.05,
+                        help="duração de cada pedido no macro-benchmark (s)")
+    parser.add_argument("--sem-macro", action="store_true",
+                        help="pula o benchmark de escalabilidade ponta a ponta")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    execucoes = [executar_suite(args) for _ in range(args.execucoes)]
+    resultados = _combinar_execucoes(execucoes)
+
+    if args.atualizar_baseline:
+        _salvar_resultados(args.saida, resultados)
+        _salvar_resultados(args.baseline, resultados)
+        print(f"📌 Baseline atualizado em {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        _salvar_resultados(args.saida, resultados)
+        for nome, metrica in resultados.items():
+            print(f"  {nome:<32} {metrica['valor']:>12.2f} {metrica['unidade']}")
+        if args.sem_baseline_ok:
+            print(f"⚠️ Nenhum baseline em {args.baseline}; nada foi comparado")
+            return 0
+        print(f"❌ Nenhum baseline em {args.baseline}: não há como detectar regressões. "
+              f"Crie um com --atualizar-baseline (ou use --sem-baseline-ok só para medir)")
+        return 1
+
+    baseline = _carregar_json(args.baseline)["resultados"]
+    linhas, regressoes, fator_maquina = _comparar(resultados, baseline, args.tolerancia)
+
+    # Uma rajada de ruído pode cobrir todas as execuções de uma métrica:
+    # só acusa a regressão se ela sobreviver a execuções extras
+    for _ in range(args.confirmacoes):
+        if not regressoes:
+            break
+        print(f"🔁 Confirmando {len(regressoes)} possível(is) regressão(ões) com mais uma execução...")
+        execucoes.append(executar_suite(args))
+        resultados = _combinar_execucoes(execucoes)
+        linhas, regressoes, fator_maquina = _comparar(resultados, baseline, args.tolerancia)
+
+    _salvar_resultados(args.saida, resultados)
+    print(f"🧮 Máquina {fator_maquina:.2f}x mais lenta que no baseline "
+          f"(tempos do baseline escalados por esse fator)")
+    print("\n".join(linhas))
+
+    if regressoes:
+        print(f"❌ {len(regressoes)} regressão(ões) acima da tolerância")
+        return 1
+    print("✅ Nenhuma regressão detectada")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,21 +4,37 @@ components.py - Componentes visuais reutilizáveis da aplicação
 """
 
 import time
+import socket
 from PySide6.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, 
-    QGroupBox, QTextEdit, QSpinBox, QGridLayout, QPushButton
+    QGroupBox, QTextEdit, QSpinBox, QGridLayout, QPushButton, QCheckBox,
+    QComboBox, QTableWidget, QTableWidgetItem, QHeaderView
 )
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QTimer, QRectF
+from PySide6.QtGui import QPainter, QPen, QBrush, QColor
 from styles import EstilosEspecificos
 
+# Mesma regra de remoto.TRANSPORTES, sem importar o módulo de rede na interface:
+# o transporte "unix" depende de AF_UNIX no processo filho
+TRANSPORTES = ("tcp", "unix") if hasattr(socket, "AF_UNIX") else ("tcp",)
+
 class PainelCozinheiro(QFrame):
     """Painel visual que representa um cozinheiro individual"""
     
+    # Caneta (borda) e pincel (fundo) de cada status, montados uma única vez:
+    # trocar de status é só repintar o painel, sem re-polish da folha de estilo
+    PINTURA_STATUS = {
+        status: (QPen(QColor(cores["borda"]), 3), QBrush(QColor(cores["fundo"])))
+        for status, cores in EstilosEspecificos.STATUS_COZINHEIRO.items()
+    }
+    
     def __init__(self, nome, emoji="👨‍🍳"):
         super().__init__()
         self.setObjectName("PainelCozinheiro")
         self.setFrameShape(QFrame.StyledPanel)
         self.tarefas_concluidas = 0
+        self.pedidos_em_preparo = 1  # > 1 quando o cozinheiro faz um lote
+        self.status = None
         
         self._setup_ui(nome, emoji)
         self.resetar()
@@ -32,6 +48,7 @@ class PainelCozinheiro(QFrame):
         
         # Status
         self.status_label = QLabel("<center>😴 Aguardando pedido...</center>")
+        self.status_label.setStyleSheet("padding: 5px;")
         
         # Barra de progresso
         self.progresso_bar = QProgressBar()
@@ -44,42 +61,75 @@ class PainelCozinheiro(QFrame):
         self.contador_label = QLabel("<center>Tarefas: 0</center>")
         self.contador_label.setStyleSheet("color: #495057; font-size: 11px; font-weight: bold;")
         
+        self.especialidades_label = QLabel()
+        self.especialidades_label.setStyleSheet("font-size: 11px;")
+        self.especialidades_label.hide()
+        
         # Adicionar widgets ao layout
         for widget in [self.nome_label, self.status_label, self.progresso_bar, 
-                      self.tempo_label, self.contador_label]:
+                      self.tempo_label, self.contador_label, self.especialidades_label]:
             layout.addWidget(widget)
         
         self.setLayout(layout)
 
     def iniciar_tarefa(self, nome_tarefa):
         """Inicia uma nova tarefa no painel"""
-        self.status_label.setText(f"<center>🔥 <b>{nome_tarefa}</b></center>")
-        self.status_label.setStyleSheet("color: #28a745; padding: 5px;")
+        cor = EstilosEspecificos.STATUS_COZINHEIRO["trabalhando"]["texto"]
+        self.status_label.setText(f"<center><font color='{cor}'>🔥 <b>{nome_tarefa}</b></font></center>")
         self.progresso_bar.setValue(0)
         self.tempo_label.setText("<center>⏱️ Trabalhando...</center>")
-        self.setProperty("status", "trabalhando")
-        self.style().unpolish(self)
-        self.style().polish(self)
+        self._aplicar_status("trabalhando")
 
     def set_progresso(self, valor):
         """Atualiza o progresso da tarefa"""
         self.progresso_bar.setValue(valor)
 
+    def set_pedidos_em_preparo(self, pedidos):
+        """Quantos pedidos a tarefa atual conclui (tamanho do lote)"""
+        self.pedidos_em_preparo = pedidos
+
     def tarefa_concluida(self, tempo_decorrido):
-        """Marca uma tarefa como concluída"""
-        self.tarefas_concluidas += 1
+        """Marca uma tarefa como concluída (conta cada pedido do lote)"""
+        self.tarefas_concluidas += self.pedidos_em_preparo
+        self.pedidos_em_preparo = 1
         self.contador_label.setText(f"<center>Tarefas: {self.tarefas_concluidas}</center>")
         self.tempo_label.setText(f"<center>⏱️ {tempo_decorrido:.1f}s</center>")
 
     def resetar(self):
         """Reseta o painel para estado inicial"""
-        self.status_label.setText("<center>😴 Aguardando pedido...</center>")
-        self.status_label.setStyleSheet("color: #6c757d; padding: 5px;")
+        cor = EstilosEspecificos.STATUS_COZINHEIRO["aguardando"]["texto"]
+        self.status_label.setText(f"<center><font color='{cor}'>😴 Aguardando pedido...</font></center>")
         self.progresso_bar.setValue(0)
         self.tempo_label.setText("<center>-</center>")
-        self.setProperty("status", "aguardando")
-        self.style().unpolish(self)
-        self.style().polish(self)
+        self._aplicar_status("aguardando")
+
+    def _aplicar_status(self, status):
+        """Troca o visual do painel: guarda o status e agenda uma repintura"""
+        if status == self.status:
+            return
+        self.status = status
+        self.update()
+
+    def paintEvent(self, evento):
+        """Pinta borda e fundo do status atual com a caneta/pincel pré-montados"""
+        super().paintEvent(evento)
+        if self.status is None:
+            return
+        caneta, pincel = self.PINTURA_STATUS[self.status]
+        pintor = QPainter(self)
+        pintor.setRenderHint(QPainter.Antialiasing)
+        pintor.setPen(caneta)
+        pintor.setBrush(pincel)
+        # margem de 5px da folha de estilo + metade da espessura da borda
+        pintor.drawRoundedRect(QRectF(self.rect()).adjusted(6.5, 6.5, -6.5, -6.5), 12, 12)
+        pintor.end()
+
+    def set_especialidades(self, pratos):
+        """Mostra os emojis das especialidades (lista vazia esconde)"""
+        if pratos:
+            emojis = " ".join(prato.split(" ", 1)[0] for prato in pratos)
+            self.especialidades_label.setText(f"<center>⭐ {emojis}</center>")
+        self.especialidades_label.setVisible(bool(pratos))
 
     def reset_contador(self):
         """Reseta apenas o contador de tarefas"""
@@ -109,12 +159,100 @@ class PainelConfiguracoes(QGroupBox):
         self.spin_tempo.setRange(1, 5)
         self.spin_tempo.setValue(2)
         layout.addWidget(self.spin_tempo, 1, 1)
+        
+        # Sequencial pelo mesmo executor do modo concorrente (comparação justa)
+        self.check_sequencial_justo = QCheckBox("Sequencial justo: 1 worker no mesmo executor")
+        layout.addWidget(self.check_sequencial_justo, 5, 0, 1, 2)
+        
+        # Pool elástico (modo concorrente)
+        self.check_elastico = QCheckBox("Pool elástico de cozinheiros")
+        layout.addWidget(self.check_elastico, 2, 0, 1, 2)
+        
+        layout.addWidget(QLabel("Cozinheiros mín / máx:"), 3, 0)
+        layout_limites = QHBoxLayout()
+        self.spin_minimo = QSpinBox()
+        self.spin_minimo.setRange(1, 8)
+        self.spin_minimo.setValue(1)
+        self.spin_maximo = QSpinBox()
+        self.spin_maximo.setRange(1, 8)
+        self.spin_maximo.setValue(6)
+        layout_limites.addWidget(self.spin_minimo)
+        layout_limites.addWidget(self.spin_maximo)
+        layout.addLayout(layout_limites, 3, 1)
+        
+        self.check_elastico.toggled.connect(self.spin_minimo.setEnabled)
+        self.check_elastico.toggled.connect(self.spin_maximo.setEnabled)
+        self.spin_minimo.setEnabled(False)
+        self.spin_maximo.setEnabled(False)
+        
+        # Cozinhas remotas (modo distribuído)
+        layout.addWidget(QLabel("Cozinhas remotas:"), 4, 0)
+        layout_remotas = QHBoxLayout()
+        self.spin_cozinhas = QSpinBox()
+        self.spin_cozinhas.setRange(1, 8)
+        self.spin_cozinhas.setValue(3)
+        self.combo_transporte = QComboBox()
+        self.combo_transporte.addItems(TRANSPORTES)
+        layout_remotas.addWidget(self.spin_cozinhas)
+        layout_remotas.addWidget(self.combo_transporte)
+        layout.addLayout(layout_remotas, 4, 1)
+        
+        # Política de despacho: fila simples, lotes ou afinidade de estação
+        layout.addWidget(QLabel("Política de despacho:"), 6, 0)
+        self.combo_politica = QComboBox()
+        self.combo_politica.addItems(["fifo", "lotes", "afinidade"])
+        layout.addWidget(self.combo_politica, 6, 1)
+        
+        layout.addWidget(QLabel("Lote máximo:"), 7, 0)
+        self.spin_lote = QSpinBox()
+        self.spin_lote.setRange(2, 8)
+        self.spin_lote.setValue(4)
+        self.spin_lote.setEnabled(False)
+        layout.addWidget(self.spin_lote, 7, 1)
+        self.combo_politica.currentTextChanged.connect(
+            lambda politica: self.spin_lote.setEnabled(politica == "lotes")
+        )
+        
+        self.check_preparo = QCheckBox("Custo de preparo por prato (troca de estação)")
+        layout.addWidget(self.check_preparo, 8, 0, 1, 2)
+        
+        self.check_especialidades = QCheckBox("Especialidades (30% mais rápido)")
+        layout.addWidget(self.check_especialidades, 9, 0, 1, 2)
     
     def get_num_pedidos(self):
         return self.spin_pedidos.value()
     
     def get_tempo_base(self):
         return self.spin_tempo.value()
+    
+    def get_sequencial_justo(self):
+        return self.check_sequencial_justo.isChecked()
+    
+    def get_elastico(self):
+        return self.check_elastico.isChecked()
+    
+    def get_limites_elastico(self):
+        """Retorna (mínimo, máximo) de cozinheiros do pool elástico"""
+        minimo = self.spin_minimo.value()
+        return minimo, max(minimo, self.spin_maximo.value())
+    
+    def get_lote_maximo(self):
+        return self.spin_lote.value()
+    
+    def get_politica(self):
+        return self.combo_politica.currentText()
+    
+    def get_fator_preparo(self):
+        return 1.0 if self.check_preparo.isChecked() else 0.0
+    
+    def get_fator_especialidade(self):
+        return 0.7 if self.check_especialidades.isChecked() else 1.0
+    
+    def get_num_cozinhas(self):
+        return self.spin_cozinhas.value()
+    
+    def get_transporte(self):
+        return self.combo_transporte.currentText()
 
 class PainelControles(QGroupBox):
     """Painel com botões de controle"""
@@ -132,24 +270,43 @@ class PainelControles(QGroupBox):
         self.botao_concorrente = QPushButton("🟢 EXECUTAR CONCORRENTE\n(Interface Livre)")
         self.botao_concorrente.setObjectName("concorrente")
         
+        self.botao_distribuido = QPushButton("🌐 EXECUTAR DISTRIBUÍDO\n(Cozinhas Remotas)")
+        self.botao_distribuido.setObjectName("distribuido")
+        
         layout.addWidget(self.botao_sequencial)
         layout.addWidget(self.botao_concorrente)
+        layout.addWidget(self.botao_distribuido)
     
-    def conectar_eventos(self, callback_sequencial, callback_concorrente):
+    def conectar_eventos(self, callback_sequencial, callback_concorrente, callback_distribuido=None):
         """Conecta os callbacks dos botões"""
         self.botao_sequencial.clicked.connect(callback_sequencial)
         self.botao_concorrente.clicked.connect(callback_concorrente)
+        if callback_distribuido is not None:
+            self.botao_distribuido.clicked.connect(callback_distribuido)
     
     def habilitar_botoes(self, habilitado=True):
         """Habilita ou desabilita os botões"""
         self.botao_sequencial.setEnabled(habilitado)
         self.botao_concorrente.setEnabled(habilitado)
+        self.botao_distribuido.setEnabled(habilitado)
 
 class PainelMetricas(QGroupBox):
     """Painel com métricas de performance"""
     
+    # Referências de comparação, da mais justa para a menos justa
+    REFERENCIAS = ["SEQUENCIAL (1 WORKER)", "SEQUENCIAL"]
+    
+    # Nomes curtos dos parâmetros da execução, para explicar configurações diferentes
+    NOMES_CONFIGURACAO = {
+        "politica": "política", "lote_maximo": "lote", "fator_preparo": "preparo",
+        "fator_especialidade": "especialidade", "pedidos": "pedidos", "tempo_base": "tempo base",
+    }
+    
     def __init__(self):
         super().__init__("📊 Métricas de Performance")
+        # (modo, configuração) -> throughput: o speedup só compara execuções
+        # com a mesma configuração, para a diferença vir só do paralelismo
+        self.throughput_por_execucao = {}
         self._setup_ui()
     
     def _setup_ui(self):
@@ -158,23 +315,111 @@ class PainelMetricas(QGroupBox):
         self.label_tempo_total = QLabel("⏱️ Tempo Total: -")
         self.label_throughput = QLabel("🚀 Throughput: -")
         self.label_eficiencia = QLabel("⚡ Eficiência: -")
+        self.label_comparacao = QLabel("📐 Speedup: -")
         
-        for label in [self.label_tempo_total, self.label_throughput, self.label_eficiencia]:
+        for label in [self.label_tempo_total, self.label_throughput,
+                      self.label_eficiencia, self.label_comparacao]:
             label.setStyleSheet(EstilosEspecificos.METRICAS_LABEL)
             layout.addWidget(label)
     
-    def atualizar_metricas(self, tempo_total, pedidos_processados, modo):
-        """Atualiza as métricas exibidas"""
+    def atualizar_metricas(self, tempo_total, pedidos_processados, modo, configuracao=None):
+        """Atualiza as métricas exibidas (`configuracao`: parâmetros que afetam o throughput)"""
         throughput = pedidos_processados / tempo_total if tempo_total > 0 else 0
         
         self.label_tempo_total.setText(f"⏱️ Tempo Total: {tempo_total:.1f}s")
         self.label_throughput.setText(f"🚀 Throughput: {throughput:.1f} pedidos/s")
         
-        if modo == "CONCORRENTE":
-            eficiencia = "🟢 Excelente (Interface livre!)"
-        else:
+        if modo == "SEQUENCIAL":
             eficiencia = "🔴 Ruim (Interface travada!)"
+        elif modo == "SEQUENCIAL (1 WORKER)":
+            eficiencia = "🟡 Interface livre, sem paralelismo"
+        else:
+            eficiencia = "🟢 Excelente (Interface livre!)"
         self.label_eficiencia.setText(f"⚡ Eficiência: {eficiencia}")
+        
+        configuracao = tuple(sorted((configuracao or {}).items()))
+        # Reinserir deixa a execução mais recente por último
+        self.throughput_por_execucao.pop((modo, configuracao), None)
+        self.throughput_por_execucao[(modo, configuracao)] = throughput
+        self._atualizar_comparacao(modo, configuracao, throughput)
+    
+    def _atualizar_comparacao(self, modo, configuracao, throughput):
+        """Compara com a melhor referência sequencial já medida com a mesma configuração"""
+        if modo in self.REFERENCIAS:
+            self.label_comparacao.setText(f"📐 Speedup: referência {modo} registrada")
+            return
+        
+        for referencia in self.REFERENCIAS:
+            throughput_ref = self.throughput_por_execucao.get((referencia, configuracao))
+            if throughput_ref:
+                speedup = throughput / throughput_ref
+                self.label_comparacao.setText(f"📐 Speedup: {speedup:.2f}x vs {referencia}")
+                return
+        
+        # Só há referências medidas com outra configuração: não dá para comparar
+        for (referencia, config_ref) in reversed(list(self.throughput_por_execucao)):
+            if referencia in self.REFERENCIAS:
+                self.label_comparacao.setText(
+                    f"📐 Speedup: configuração diferente de {referencia} "
+                    f"({self._descrever_diferencas(config_ref, configuracao)}); "
+                    f"repita o modo sequencial com a mesma configuração"
+                )
+                return
+        self.label_comparacao.setText("📐 Speedup: execute um modo sequencial para comparar")
+    
+    def _descrever_diferencas(self, referencia, atual):
+        """Lista os parâmetros que mudaram, ex.: política fifo → lotes, preparo 0.0 → 0.5"""
+        referencia, atual = dict(referencia), dict(atual)
+        return ", ".join(
+            f"{self.NOMES_CONFIGURACAO.get(chave, chave)} {referencia.get(chave, '-')} → {atual.get(chave, '-')}"
+            for chave in sorted(set(referencia) | set(atual))
+            if referencia.get(chave) != atual.get(chave)
+        )
+
+class PainelCozinhasRemotas(QGroupBox):
+    """Painel com o throughput de cada cozinha remota"""
+    
+    COLUNAS = ["Cozinha", "Status", "Em preparo", "Progresso", "Pedidos", "Pedidos/s", "RTT médio"]
+    
+    def __init__(self):
+        super().__init__("🌐 Cozinhas Remotas")
+        self._setup_ui()
+    
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        
+        self.tabela = QTableWidget(0, len(self.COLUNAS))
+        self.tabela.setHorizontalHeaderLabels(self.COLUNAS)
+        self.tabela.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.tabela.verticalHeader().setVisible(False)
+        self.tabela.setMaximumHeight(180)
+        layout.addWidget(self.tabela)
+        
+        self.label_resumo = QLabel("🧾 Serialização: -")
+        layout.addWidget(self.label_resumo)
+    
+    def atualizar(self, linhas):
+        """Atualiza a tabela com as estatísticas do coordenador"""
+        self.tabela.setRowCount(len(linhas))
+        for i, linha in enumerate(linhas):
+            valores = [
+                linha["cozinha"],
+                linha["status"],
+                str(linha["em_preparo"]),
+                f"{linha['progresso']:.0f}%",
+                str(linha["concluidos"]),
+                f"{linha['throughput']:.2f}",
+                f"{linha['rtt_ms']:.2f} ms",
+            ]
+            for coluna, valor in enumerate(valores):
+                self.tabela.setItem(i, coluna, QTableWidgetItem(valor))
+    
+    def atualizar_resumo(self, custo_us, bytes_enviados, bytes_recebidos):
+        """Mostra o custo de comunicação medido no coordenador"""
+        self.label_resumo.setText(
+            f"🧾 Serialização: {custo_us:.1f} µs/mensagem • "
+            f"{bytes_enviados} B enviados • {bytes_recebidos} B recebidos"
+        )
 
 class PainelLog(QGroupBox):
     """Painel com log de execução"""
@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+"""
+cozinha.py - Núcleo de despacho da fila de pedidos (independente da UI)
+"""
+
+import time
+from collections import deque
+
+from PySide6.QtCore import (
+    QObject, QThreadPool, QMutex, QEventLoop, QCoreApplication, QTimer, Signal
+)
+
+from worker import Worker, TaskManager
+
+_app = None
+
+class SelecaoFifo:
+    """Política padrão: o cozinheiro livre pega o pedido da frente da fila"""
+
+    nome = "fifo"
+
+    def escolher(self, cozinha, id_cozinheiro):
+        """
+        Retorna (índices da fila a despachar, None) ou, se nada deve sair
+        agora, ([], segundos até valer a pena tentar de novo).
+        """
+        return [0], None
+
+class Cozinha(QObject):
+    """
+    Fila de pedidos + despacho para os cozinheiros.
+    Não conhece nenhum widget: a janela (ou um benchmark) apenas escuta os sinais.
+    O número de cozinheiros pode mudar durante a execução (ver elastico.py).
+    """
+    tarefa_despachada = Signal(int, object)   # id_cozinheiro, worker
+    tarefa_concluida = Signal(int, str)       # id_cozinheiro, nome_tarefa
+    execucao_finalizada = Signal(int, float)  # pedidos processados, tempo total
+    cozinheiro_adicionado = Signal(int)
+    cozinheiro_retirado = Signal(int)
+
+    def __init__(self, num_cozinheiros=3, tempo_base=2.0, variacao=(0.5, 1.5),
+                 passos=100, fator_preparo=0.0, selecao=None, fator_especialidade=1.0,
+                 parent=None):
+        super().__init__(parent)
+        self.tempo_base = tempo_base
+        self.variacao = variacao
+        self.passos = passos
+        # 0 desliga o custo de preparo; 1 usa TaskManager.TEMPO_PREPARO como está
+        self.fator_preparo = fator_preparo
+        # Multiplica o tempo de cozimento das especialidades (1 = sem efeito)
+        self.fator_especialidade = fator_especialidade
+        self.selecao = selecao or SelecaoFifo()
+
+        # Pool próprio: cada cozinheiro precisa da sua thread, mesmo que a
+        # máquina tenha menos núcleos (o trabalho simulado é só espera)
+        self.thread_pool = QThreadPool()
+        self.mutex = QMutex()
+        self.fila_de_tarefas = deque()
+        self.tempos_chegada = deque()  # anda junto com fila_de_tarefas
+        self.ativos = set(range(num_cozinheiros))
+        self.ocupados = set()
+        self.a_retirar = set()
+        self._ajustar_pool()
+
+        self.entrada_aberta = False
+        self.em_andamento = 0
+        self.pedidos_processados = 0
+        self.timer_inicio = None
+
+        # Histórico para métricas: (instante de início, espera), latências
+        # e (instante de conclusão, latência)
+        self.esperas = []
+        self.latencias = []
+        self.conclusoes = []
+        self._chegada_em_andamento = {}
+        self._despertar_agendado = False
+
+        # Estação quente: repetir o último prato dispensa o preparo
+        self.ultimo_prato = {}
+        self.despachos = 0
+        self.acertos_estacao = 0
+
+    @property
+    def num_cozinheiros(self):
+        return len(self.ativos)
+
+    def _ajustar_pool(self):
+        self.thread_pool.setMaxThreadCount(max(1, len(self.ativos)))
+
+    # ==================== FILA ====================
+
+    def carregar_tarefas(self, tarefas):
+        """Substitui a fila atual pelas tarefas informadas"""
+        agora = time.time()
+        self.fila_de_tarefas.clear()
+        self.tempos_chegada.clear()
+        self.fila_de_tarefas.extend(tarefas)
+        self.tempos_chegada.extend(agora for _ in self.fila_de_tarefas)
+
+    def adicionar_tarefas(self, tarefas):
+        """Acrescenta pedidos à fila (chegada em rajada) e acorda cozinheiros ociosos"""
+        agora = time.time()
+        self.mutex.lock()
+        for tarefa in tarefas:
+            self.fila_de_tarefas.append(tarefa)
+            self.tempos_chegada.append(agora)
+        self.mutex.unlock()
+
+        if self.timer_inicio is not None:
+            self._acordar_ociosos()
+
+    def encerrar_entrada(self):
+        """Indica que não chegarão mais pedidos"""
+        self.entrada_aberta = False
+        self._verificar_fim()
+
+    def taxa_acerto_estacao(self):
+        """Fração dos despachos que caíram numa estação já quente para o prato"""
+        return self.acertos_estacao / self.despachos if self.despachos else 0.0
+
+    def espera_mais_antiga(self):
+        """Há quanto tempo o pedido mais antigo da fila está esperando (s)"""
+        if not self.tempos_chegada:
+            return 0.0
+        return time.time() - self.tempos_chegada[0]
+
+    # ==================== COZINHEIROS ====================
+
+    def adicionar_cozinheiro(self):
+        """Coloca mais um cozinheiro para trabalhar; retorna o id dele"""
+        if self.a_retirar:
+            # Mais barato desistir de uma dispensa pendente
+            id_cozinheiro = self.a_retirar.pop()
+            return id_cozinheiro
+
+        id_cozinheiro = 0
+        while id_cozinheiro in self.ativos:
+            id_cozinheiro += 1
+        self.ativos.add(id_cozinheiro)
+        self._ajustar_pool()
+        self.cozinheiro_adicionado.emit(id_cozinheiro)
+
+        if self.timer_inicio is not None:
+            self._despachar_proxima_tarefa(id_cozinheiro)
+        return id_cozinheiro
+
+    def retirar_cozinheiro(self):
+        """
+        Dispensa um cozinheiro: um ocioso sai na hora, um ocupado sai
+        ao terminar o pedido atual. Retorna o id ou None.
+        """
+        candidatos = self.ativos - self.a_retirar
+        if not candidatos:
+            return None
+
+        ociosos = candidatos - self.ocupados
+        id_cozinheiro = max(ociosos or candidatos)
+        if id_cozinheiro in ociosos:
+            self._remover_cozinheiro(id_cozinheiro)
+        else:
+            self.a_retirar.add(id_cozinheiro)
+        return id_cozinheiro
+
+    def _remover_cozinheiro(self, id_cozinheiro):
+        self.ativos.discard(id_cozinheiro)
+        self.a_retirar.discard(id_cozinheiro)
+        self.ultimo_prato.pop(id_cozinheiro, None)
+        self._ajustar_pool()
+        self.cozinheiro_retirado.emit(id_cozinheiro)
+
+    def _acordar_ociosos(self):
+        for id_cozinheiro in sorted(self.ativos - self.ocupados - self.a_retirar):
+            if not self._despachar_proxima_tarefa(id_cozinheiro):
+                break
+
+    # ==================== DESPACHO ====================
+
+    def iniciar(self):
+        """Despacha a primeira tarefa para cada cozinheiro"""
+        self.pedidos_processados = 0
+        self.esperas = []
+        self.latencias = []
+        self.conclusoes = []
+        self.despachos = 0
+        self.acertos_estacao = 0
+        self.timer_inicio = time.time()
+
+        self._acordar_ociosos()
+        self._verificar_fim()
+
+    def _retirar_da_fila(self, indices):
+        """Remove os pedidos nos índices dados; retorna (tarefas, chegadas) na ordem da fila"""
+        if indices == [0]:
+            return [self.fila_de_tarefas.popleft()], [self.tempos_chegada.popleft()]
+
+        tarefas = [self.fila_de_tarefas[i] for i in indices]
+        chegadas = [self.tempos_chegada[i] for i in indices]
+        for i in sorted(indices, reverse=True):
+            del self.fila_de_tarefas[i]
+            del self.tempos_chegada[i]
+        return tarefas, chegadas
+
+    def _agendar_despertar(self, segundos):
+        """Tenta despachar de novo quando a política de seleção pedir"""
+        if segundos is None or self._despertar_agendado:
+            return
+        self._despertar_agendado = True
+        QTimer.singleShot(max(1, int(segundos * 1000)), self, self._despertar)
+
+    def _despertar(self):
+        self._despertar_agendado = False
+        self._acordar_ociosos()
+
+    def _despachar_proxima_tarefa(self, id_cozinheiro):
+        """Despacha a próxima tarefa (ou lote) para um cozinheiro; retorna False se nada saiu"""
+        self.mutex.lock()
+
+        if not self.fila_de_tarefas:
+            self.mutex.unlock()
+            return False
+
+        indices, espera = self.selecao.escolher(self, id_cozinheiro)
+        if not indices:
+            self.mutex.unlock()
+            self._agendar_despertar(espera)
+            return False
+
+        tarefas, chegadas = self._retirar_da_fila(indices)
+        self.em_andamento += 1
+        self.ocupados.add(id_cozinheiro)
+        self.mutex.unlock()
+
+        agora = time.time()
+        self.esperas.extend((agora, agora - chegada) for chegada in chegadas)
+
+        prato = TaskManager.extrair_prato(tarefas[0])
+        if len(tarefas) == 1:
+            nome_tarefa = tarefas[0]
+        else:
+            nome_tarefa = f"Lote {len(tarefas)}× {prato}"
+        self._chegada_em_andamento[(id_cozinheiro, nome_tarefa)] = chegadas
+
+        estacao_quente = self.ultimo_prato.get(id_cozinheiro) == prato
+        self.ultimo_prato[id_cozinheiro] = prato
+        self.despachos += 1
+        if estacao_quente:
+            self.acertos_estacao += 1
+
+        tempo_preparo = 0.0 if estacao_quente else self.fator_preparo * TaskManager.tempo_preparo(prato)
+        fator_tempo = (self.fator_especialidade
+                       if prato in TaskManager.especialidades(id_cozinheiro) else 1.0)
+
+        worker = Worker(id_cozinheiro, nome_tarefa, self.tempo_base,
+                        self.variacao, self.passos, tarefas, tempo_preparo, fator_tempo)
+        worker.sinais.concluido.connect(self._tarefa_concluida)
+        self.tarefa_despachada.emit(id_cozinheiro, worker)
+
+        self.thread_pool.start(worker)
+        return True
+
+    def _tarefa_concluida(self, id_cozinheiro, nome_tarefa):
+        """Callback chamado quando uma tarefa é concluída"""
+        chegadas = self._chegada_em_andamento.pop((id_cozinheiro, nome_tarefa), [None])
+
+        self.mutex.lock()
+        self.em_andamento -= 1
+        self.pedidos_processados += len(chegadas)
+        self.ocupados.discard(id_cozinheiro)
+        self.mutex.unlock()
+
+        agora = time.time()
+        latencias = [agora - chegada for chegada in chegadas if chegada is not None]
+        self.latencias.extend(latencias)
+        self.conclusoes.extend((agora, latencia) for latencia in latencias)
+
+        self.tarefa_concluida.emit(id_cozinheiro, nome_tarefa)
+
+        if id_cozinheiro in self.a_retirar:
+            self._remover_cozinheiro(id_cozinheiro)
+        else:
+            self._despachar_proxima_tarefa(id_cozinheiro)
+
+        self._verificar_fim()
+
+    def _verificar_fim(self):
+        """Só finaliza quando não chegam mais pedidos, não há fila nem ninguém cozinhando"""
+        if self.timer_inicio is None or self.entrada_aberta:
+            return
+        if self.fila_de_tarefas or self.em_andamento:
+            return
+        self._finalizar()
+
+    def _finalizar(self):
+        """Emite o resultado da execução"""
+        tempo_total = time.time() - self.timer_inicio
+        self.timer_inicio = None
+        self.execucao_finalizada.emit(self.pedidos_processados, tempo_total)
+
+# ==================== EXECUÇÃO SEM INTERFACE ====================
+
+def garantir_aplicacao():
+    """Retorna a aplicação Qt atual, criando uma QCoreApplication se necessário"""
+    global _app
+    app = QCoreApplication.instance()
+    if app is None:
+        _app = app = QCoreApplication([])
+    return app
+
+def aguardar_finalizacao(cozinha, disparo=None):
+    """Chama `disparo` (se houver) e roda o loop de eventos até a cozinha finalizar"""
+    resultado = {}
+    loop = QEventLoop()
+
+    def _ao_finalizar(pedidos, tempo_total):
+        resultado["pedidos"] = pedidos
+        resultado["tempo_total"] = tempo_total
+        loop.quit()
+
+    cozinha.execucao_finalizada.connect(_ao_finalizar)
+    if disparo is not None:
+        disparo()
+    if not resultado:
+        loop.exec()
+    cozinha.execucao_finalizada.disconnect(_ao_finalizar)
+    return resultado
+
+def agendar_chegadas(cozinha, chegadas):
+    """
+    Agenda pedidos que chegam depois do início: `chegadas` é uma lista de
+    (atraso em segundos, lista de tarefas). A entrada é encerrada após a última.
+    """
+    if not chegadas:
+        return
+    cozinha.entrada_aberta = True
+    ultimo_atraso = max(atraso for atraso, _ in chegadas)
+
+    for atraso, tarefas in chegadas:
+        QTimer.singleShot(int(atraso * 1000), cozinha,
+                          lambda tarefas=tarefas: cozinha.adicionar_tarefas(tarefas))
+    QTimer.singleShot(int(ultimo_atraso * 1000), cozinha, cozinha.encerrar_entrada)
+
+def percentil(valores, p):
+    """Percentil simples (vizinho mais próximo) de uma lista de valores"""
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    indice = min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))
+    return ordenados[indice]
+
+def executar_headless(num_cozinheiros, tarefas, tempo_base=2.0,
+                      variacao=(0.5, 1.5), passos=100, chegadas=None, preparar=None,
+                      fator_preparo=0.0, selecao=None, fator_especialidade=1.0):
+    """
+    Executa uma simulação completa sem UI e devolve as métricas.
+    `preparar(cozinha)` permite anexar extras (ex.: controlador elástico) antes do início.
+    """
+    garantir_aplicacao()
+
+    cozinha = Cozinha(num_cozinheiros, tempo_base, variacao, passos, fator_preparo,
+                      selecao, fator_especialidade)
+    cozinha.carregar_tarefas(tarefas)
+    agendar_chegadas(cozinha, chegadas)
+    if preparar is not None:
+        preparar(cozinha)
+
+    resultado = aguardar_finalizacao(cozinha, cozinha.iniciar)
+    cozinha.thread_pool.waitForDone()
+
+    tempo_total = resultado["tempo_total"]
+    esperas = [espera for _, espera in cozinha.esperas]
+    return {
+        "num_cozinheiros": num_cozinheiros,
+        "pedidos": resultado["pedidos"],
+        "tempo_total": tempo_total,
+        "throughput": resultado["pedidos"] / tempo_total if tempo_total > 0 else 0,
+        "espera_media": sum(esperas) / len(esperas) if esperas else 0.0,
+        "latencia_media": sum(cozinha.latencias) / len(cozinha.latencias) if cozinha.latencias else 0.0,
+        "latencia_p95": percentil(cozinha.latencias, 95),
+        "taxa_acerto_estacao": cozinha.taxa_acerto_estacao(),
+        "despachos": cozinha.despachos,
+    }
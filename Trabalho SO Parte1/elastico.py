@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+"""
+elastico.py - Pool elástico de cozinheiros (autoscaling)
+
+O controlador observa a Cozinha em intervalos regulares e adiciona ou
+dispensa cozinheiros conforme a profundidade da fila, o tempo de espera e
+a utilização, respeitando mínimo, máximo e um cooldown entre decisões.
+
+    python elastico.py               # compara pool fixo vs elástico com pedidos em rajadas
+    python elastico.py --verificar   # confere que crescer/encolher não perde nem repete pedidos
+"""
+
+import sys
+import math
+import time
+import random
+from collections import Counter
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+class PoliticaLimiar:
+    """Cresce com fila longa ou espera alta; encolhe quando sobra gente ociosa"""
+
+    nome = "limiar"
+
+    def __init__(self, fila_por_cozinheiro=2.0, espera_maxima=1.0, utilizacao_minima=0.5):
+        self.fila_por_cozinheiro = fila_por_cozinheiro
+        self.espera_maxima = espera_maxima
+        self.utilizacao_minima = utilizacao_minima
+
+    def decidir(self, amostra):
+        """Retorna quantos cozinheiros adicionar (positivo) ou dispensar (negativo)"""
+        if (amostra["fila"] > self.fila_por_cozinheiro * amostra["ativos"]
+                or amostra["espera"] > self.espera_maxima):
+            return 1
+        if amostra["fila"] == 0 and amostra["utilizacao"] < self.utilizacao_minima:
+            return -1
+        return 0
+
+class PoliticaAlvo:
+    """Target tracking: dimensiona o pool para manter a utilização perto do alvo"""
+
+    nome = "alvo"
+
+    def __init__(self, utilizacao_alvo=0.8, fila_por_cozinheiro=2.0):
+        self.utilizacao_alvo = utilizacao_alvo
+        self.fila_por_cozinheiro = fila_por_cozinheiro
+
+    def decidir(self, amostra):
+        """Retorna a diferença entre o tamanho desejado e o atual"""
+        demanda = amostra["ativos"] * amostra["utilizacao"] / self.utilizacao_alvo
+        desejado = math.ceil(demanda + amostra["fila"] / self.fila_por_cozinheiro)
+        return desejado - amostra["ativos"]
+
+POLITICAS = {
+    PoliticaLimiar.nome: PoliticaLimiar,
+    PoliticaAlvo.nome: PoliticaAlvo,
+}
+
+class ControladorElastico(QObject):
+    """
+    Controlador de autoscaling sobre a Cozinha.
+    Cada decisão é registrada em `historico` e, após o cooldown, complementada
+    com o efeito observado na latência dos pedidos concluídos depois dela.
+    """
+    decisao = Signal(str)
+
+    def __init__(self, cozinha, minimo=1, maximo=8, cooldown=2.0, intervalo_ms=250,
+                 politica=None, passo_maximo=2, parent=None):
+        super().__init__(parent or cozinha)
+        self.cozinha = cozinha
+        self.minimo = minimo
+        self.maximo = maximo
+        self.cooldown = cooldown
+        self.passo_maximo = passo_maximo
+        self.politica = politica or PoliticaLimiar()
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(intervalo_ms)
+        self.timer.timeout.connect(self._avaliar)
+
+        self.historico = []
+        self.cozinheiro_segundos = 0.0
+        self._amostras_utilizacao = []
+        self._ultima_decisao = None
+        self._ultima_amostra = None
+        self._pendente = None
+
+    def iniciar(self):
+        """Ajusta o pool aos limites e começa a observar a cozinha"""
+        while self._efetivos() < self.minimo:
+            self.cozinha.adicionar_cozinheiro()
+        while self._efetivos() > self.maximo:
+            self.cozinha.retirar_cozinheiro()
+
+        self._ultima_amostra = time.time()
+        self.cozinha.execucao_finalizada.connect(self.parar)
+        self.timer.start()
+
+    def parar(self, *_):
+        """Para de observar e fecha a medição pendente"""
+        self.timer.stop()
+        self._contabilizar_custo(time.time())
+        if self._pendente is not None:
+            self._fechar_efeito(time.time())
+
+    # ==================== MEDIÇÃO ====================
+
+    def _efetivos(self):
+        """Cozinheiros que ainda vão receber pedidos (exclui dispensas pendentes)"""
+        return len(self.cozinha.ativos - self.cozinha.a_retirar)
+
+    def _contabilizar_custo(self, agora):
+        if self._ultima_amostra is not None:
+            self.cozinheiro_segundos += self.cozinha.num_cozinheiros * (agora - self._ultima_amostra)
+        self._ultima_amostra = agora
+
+    def _amostrar(self, agora):
+        ativos = self._efetivos()
+        self._contabilizar_custo(agora)
+        self._amostras_utilizacao.append(
+            len(self.cozinha.ocupados) / self.cozinha.num_cozinheiros
+            if self.cozinha.num_cozinheiros else 1.0
+        )
+        return {
+            "fila": len(self.cozinha.fila_de_tarefas),
+            "ativos": ativos,
+            "ocupados": len(self.cozinha.ocupados),
+            "espera": self.cozinha.espera_mais_antiga(),
+            "utilizacao": sum(self._amostras_utilizacao) / len(self._amostras_utilizacao),
+        }
+
+    @staticmethod
+    def _media_no_intervalo(registros, inicio, fim):
+        """Média dos valores de (instante, valor) com instante em [inicio, fim)"""
+        valores = [valor for instante, valor in registros if inicio <= instante < fim]
+        return sum(valores) / len(valores) if valores else None
+
+    def _espera_media(self, inicio, fim):
+        """Espera média dos pedidos iniciados no intervalo"""
+        return self._media_no_intervalo(self.cozinha.esperas, inicio, fim)
+
+    def _latencia_media(self, inicio, fim):
+        """Latência média (chegada → conclusão) dos pedidos concluídos no intervalo"""
+        return self._media_no_intervalo(self.cozinha.conclusoes, inicio, fim)
+
+    # ==================== DECISÃO ====================
+
+    def _avaliar(self):
+        agora = time.time()
+        amostra = self._amostrar(agora)
+
+        if self._pendente is not None and agora - self._pendente["instante"] >= self.cooldown:
+            self._fechar_efeito(agora)
+
+        if self._ultima_decisao is not None and agora - self._ultima_decisao < self.cooldown:
+            return
+
+        delta = self.politica.decidir(amostra)
+        delta = max(-self.passo_maximo, min(self.passo_maximo, delta))
+        delta = max(self.minimo - amostra["ativos"], min(self.maximo - amostra["ativos"], delta))
+        if delta == 0:
+            return
+
+        registro = {
+            "instante": agora,
+            "de": amostra["ativos"],
+            "para": amostra["ativos"] + delta,
+            "fila": amostra["fila"],
+            "espera": amostra["espera"],
+            "utilizacao": amostra["utilizacao"],
+            "latencia_antes": self._latencia_media(agora - self.cooldown, agora),
+            "latencia_depois": None,
+            "espera_antes": self._espera_media(agora - self.cooldown, agora),
+            "espera_depois": None,
+        }
+        self.historico.append(registro)
+        self._pendente = registro
+        self._ultima_decisao = agora
+        self._amostras_utilizacao = []
+
+        seta = "📈" if delta > 0 else "📉"
+        self.decisao.emit(
+            f"{seta} Pool {registro['de']} → {registro['para']} cozinheiros "
+            f"(fila={registro['fila']}, espera={registro['espera']:.1f}s, "
+            f"utilização={registro['utilizacao']:.0%}) [{self.politica.nome}]"
+        )
+
+        for _ in range(abs(delta)):
+            if delta > 0:
+                self.cozinha.adicionar_cozinheiro()
+            else:
+                self.cozinha.retirar_cozinheiro()
+
+    def _fechar_efeito(self, agora):
+        """Completa a última decisão com a latência observada depois dela"""
+        registro = self._pendente
+        self._pendente = None
+        registro["latencia_depois"] = self._latencia_media(registro["instante"], agora)
+        registro["espera_depois"] = self._espera_media(registro["instante"], agora)
+
+        antes, depois = registro["latencia_antes"], registro["latencia_depois"]
+        if antes is None or depois is None:
+            self.decisao.emit("   ↳ efeito: sem pedidos concluídos suficientes para medir")
+            return
+
+        efeito = f"   ↳ efeito: latência média {antes:.2f}s → {depois:.2f}s"
+        if registro["espera_antes"] is not None and registro["espera_depois"] is not None:
+            efeito += f" (espera {registro['espera_antes']:.2f}s → {registro['espera_depois']:.2f}s)"
+        self.decisao.emit(efeito)
+
+# ==================== VERIFICAÇÃO SEM INTERFACE ====================
+
+def verificar_escalonamento(rodadas=10, num_pedidos=30, semente=0, prazo=20.0):
+    """
+    Cresce e encolhe o pool no meio da execução (inclusive desistindo de
+    dispensas pendentes) e confere que cada pedido foi feito exatamente uma
+    vez. Retorna a lista de problemas encontrados (vazia = tudo certo).
+    """
+    from worker import TaskManager
+    from cozinha import Cozinha, aguardar_finalizacao, agendar_chegadas, garantir_aplicacao
+
+    garantir_aplicacao()
+    sorteio = random.Random(semente)
+    problemas = []
+
+    for rodada in range(1, rodadas + 1):
+        tarefas = TaskManager.gerar_lista_tarefas(num_pedidos)
+        metade = num_pedidos // 2
+        cozinha = Cozinha(2, tempo_base=0.02, variacao=(0, 0.03), passos=2)
+        cozinha.carregar_tarefas(tarefas[:metade])
+        agendar_chegadas(cozinha, [(0.15, tarefas[metade:])])
+
+        concluidas = []
+        cozinha.tarefa_concluida.connect(lambda _id, nome: concluidas.append(nome))
+
+        def _despachada(id_cozinheiro, worker, rodada=rodada, cozinha=cozinha):
+            if id_cozinheiro not in cozinha.ativos or id_cozinheiro in cozinha.a_retirar:
+                problemas.append(f"rodada {rodada}: pedido entregue ao cozinheiro "
+                                 f"{id_cozinheiro}, que não está mais no turno")
+        cozinha.tarefa_despachada.connect(_despachada)
+
+        def _operar(operacao, cozinha=cozinha):
+            # Nunca zera o pool: sem cozinheiros a execução não terminaria
+            pode_retirar = len(cozinha.ativos - cozinha.a_retirar) > 1
+            if operacao == "adicionar":
+                cozinha.adicionar_cozinheiro()
+            elif operacao == "retirar" and pode_retirar:
+                cozinha.retirar_cozinheiro()
+            elif operacao == "retirar_e_desistir" and pode_retirar:
+                cozinha.retirar_cozinheiro()
+                cozinha.adicionar_cozinheiro()
+
+        for _ in range(12):
+            operacao = sorteio.choice(("adicionar", "retirar", "retirar_e_desistir"))
+            QTimer.singleShot(sorteio.randint(5, 300), cozinha,
+                              lambda operacao=operacao: _operar(operacao))
+
+        def _travou(rodada=rodada, cozinha=cozinha):
+            if cozinha.timer_inicio is not None:
+                problemas.append(f"rodada {rodada}: execução não terminou em {prazo:.0f}s")
+                cozinha._finalizar()
+        QTimer.singleShot(int(prazo * 1000), cozinha, _travou)
+
+        resultado = aguardar_finalizacao(cozinha, cozinha.iniciar)
+        cozinha.thread_pool.waitForDone()
+
+        contagem = Counter(concluidas)
+        faltando = [t for t in tarefas if contagem[t] == 0]
+        repetidos = [t for t, vezes in contagem.items() if vezes > 1]
+        if faltando:
+            problemas.append(f"rodada {rodada}: {len(faltando)} pedido(s) nunca feitos")
+        if repetidos:
+            problemas.append(f"rodada {rodada}: {len(repetidos)} pedido(s) feitos mais de uma vez")
+        if resultado["pedidos"] != num_pedidos:
+            problemas.append(f"rodada {rodada}: {resultado['pedidos']} processados, "
+                             f"esperado {num_pedidos}")
+        if cozinha.a_retirar or cozinha.ocupados:
+            problemas.append(f"rodada {rodada}: estado final inconsistente "
+                             f"(a_retirar={cozinha.a_retirar}, ocupados={cozinha.ocupados})")
+
+    return problemas
+
+# ==================== COMPARAÇÃO SEM INTERFACE ====================
+
+def main():
+    import argparse
+    from worker import TaskManager
+    from cozinha import executar_headless
+
+    parser = argparse.ArgumentParser(description="Pool fixo vs pool elástico com pedidos em rajadas")
+    parser.add_argument("--minimo", type=int, default=1)
+    parser.add_argument("--maximo", type=int, default=6)
+    parser.add_argument("--cooldown", type=float, default=1.0)
+    parser.add_argument("--politica", choices=sorted(POLITICAS), default="limiar")
+    parser.add_argument("--rajadas", type=int, default=3)
+    parser.add_argument("--pedidos-por-rajada", type=int, default=12)
+    parser.add_argument("--intervalo", type=float, default=4.0, help="segundos entre rajadas")
+    parser.add_argument("--tempo-tarefa", type=float, default=0.5)
+    parser.add_argument("--verificar", action="store_true",
+                        help="só confere que crescer/encolher não perde nem repete pedidos")
+    parser.add_argument("--rodadas", type=int, default=10, help="rodadas da verificação")
+    args = parser.parse_args()
+
+    if args.verificar:
+        problemas = verificar_escalonamento(args.rodadas)
+        for problema in problemas:
+            print(f"❌ {problema}")
+        if problemas:
+            return 1
+        print(f"✅ {args.rodadas} rodadas: todo pedido feito exatamente uma vez")
+        return 0
+
+    chegadas = [
+        (i * args.intervalo,
+         TaskManager.gerar_lista_tarefas(args.pedidos_por_rajada, i * args.pedidos_por_rajada + 1))
+        for i in range(args.rajadas)
+    ]
+    parametros = dict(tempo_base=args.tempo_tarefa, variacao=(0, 0.2), passos=10, chegadas=chegadas)
+
+    cenarios = []
+    for fixo in (args.minimo, args.maximo):
+        resultado = executar_headless(fixo, [], **parametros)
+        resultado["cozinheiro_segundos"] = fixo * resultado["tempo_total"]
+        cenarios.append((f"fixo ({fixo})", resultado))
+
+    controladores = []
+
+    def _anexar_controlador(cozinha):
+        controlador = ControladorElastico(
+            cozinha, args.minimo, args.maximo, args.cooldown,
+            politica=POLITICAS[args.politica]()
+        )
+        controlador.decisao.connect(print)
+        controlador.iniciar()
+        controladores.append(controlador)
+
+    resultado = executar_headless(args.minimo, [], preparar=_anexar_controlador, **parametros)
+    resultado["cozinheiro_segundos"] = controladores[0].cozinheiro_segundos
+    cenarios.append((f"elástico ({args.politica})", resultado))
+
+    print(f"\n{'cenário':<20} {'tempo':>8} {'espera méd':>11} {'latência p95':>13} {'coz·s':>8}")
+    for nome, resultado in cenarios:
+        print(f"{nome:<20} {resultado['tempo_total']:>7.1f}s {resultado['espera_media']:>10.2f}s "
+              f"{resultado['latencia_p95']:>12.2f}s {resultado['cozinheiro_segundos']:>8.1f}")
+
+if __name__ == "__main__":
+    sys.exit(main())
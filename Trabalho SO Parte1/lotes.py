@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+lotes.py - Agrupamento de pedidos iguais em lotes
+
+Cada prato tem um tempo de preparo da estação (TaskManager.TEMPO_PREPARO).
+Agrupando pedidos do mesmo prato, um cozinheiro paga esse preparo uma vez
+por lote: o throughput sobe, mas um pedido pode esperar o lote encher.
+
+    python lotes.py --lote-maximo 2 4 8 --atraso 0.5
+"""
+
+import time
+import argparse
+
+from worker import TaskManager
+
+class AgrupadorLotes:
+    """
+    Política de seleção da Cozinha que despacha lotes do mesmo prato.
+    Um lote incompleto só sai quando o pedido mais antigo dele já esperou
+    `atraso_maximo` segundos ou quando não chegarão mais pedidos.
+    """
+
+    nome = "lotes"
+
+    def __init__(self, lote_maximo=4, atraso_maximo=0.0):
+        self.lote_maximo = lote_maximo
+        self.atraso_maximo = atraso_maximo
+
+    def escolher(self, cozinha, id_cozinheiro):
+        """Retorna o primeiro lote pronto, na ordem de chegada do seu pedido mais antigo"""
+        grupos = {}
+        for indice, nome_tarefa in enumerate(cozinha.fila_de_tarefas):
+            grupos.setdefault(TaskManager.extrair_prato(nome_tarefa), []).append(indice)
+
+        agora = time.time()
+        menor_espera = None
+        for indices in grupos.values():
+            lote = indices[:self.lote_maximo]
+            idade = agora - cozinha.tempos_chegada[lote[0]]
+            if (len(lote) == self.lote_maximo or not cozinha.entrada_aberta
+                    or idade >= self.atraso_maximo):
+                return lote, None
+
+            falta = self.atraso_maximo - idade
+            menor_espera = falta if menor_espera is None else min(menor_espera, falta)
+
+        return [], menor_espera
+
+# ==================== COMPARAÇÃO SEM INTERFACE ====================
+
+def comparar_lotes(num_cozinheiros, num_pedidos, tamanhos, atraso_maximo, intervalo_chegada,
+                   tempo_base, fator_preparo):
+    """Roda sem lotes e com cada tamanho máximo de lote sobre a mesma carga"""
+    from cozinha import executar_headless
+
+    tarefas = TaskManager.gerar_lista_tarefas(num_pedidos)
+    if intervalo_chegada > 0:
+        iniciais = []
+        chegadas = [(i * intervalo_chegada, [tarefa]) for i, tarefa in enumerate(tarefas)]
+    else:
+        iniciais, chegadas = tarefas, None
+
+    parametros = dict(tempo_base=tempo_base, variacao=(0, 0.1), passos=10,
+                      chegadas=chegadas, fator_preparo=fator_preparo)
+
+    resultados = [("sem lotes", executar_headless(num_cozinheiros, iniciais, **parametros))]
+    for tamanho in tamanhos:
+        agrupador = AgrupadorLotes(tamanho, atraso_maximo)
+        resultados.append((
+            f"lote ≤ {tamanho}",
+            executar_headless(num_cozinheiros, iniciais, selecao=agrupador, **parametros),
+        ))
+    return resultados
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput vs latência com pedidos em lotes")
+    parser.add_argument("--cozinheiros", type=int, default=3)
+    parser.add_argument("--pedidos", type=int, default=40)
+    parser.add_argument("--lote-maximo", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--atraso", type=float, default=0.5,
+                        help="espera máxima para completar um lote (s)")
+    parser.add_argument("--intervalo-chegada", type=float, default=0.1,
+                        help="segundos entre chegadas; 0 = todos os pedidos no início")
+    parser.add_argument("--tempo-base", type=float, default=0.2)
+    parser.add_argument("--fator-preparo", type=float, default=0.5,
+                        help="escala aplicada a TaskManager.TEMPO_PREPARO")
+    args = parser.parse_args()
+
+    resultados = comparar_lotes(args.cozinheiros, args.pedidos, args.lote_maximo, args.atraso,
+                                args.intervalo_chegada, args.tempo_base, args.fator_preparo)
+
+    _, base = resultados[0]
+    print(f"{'cenário':<12} {'pedidos/s':>10} {'Δ thr':>8} {'latência méd':>13} "
+          f"{'Δ latência':>11} {'p95':>8}")
+    for nome, resultado in resultados:
+        ganho = resultado["throughput"] / base["throughput"] - 1 if base["throughput"] else 0
+        atraso = resultado["latencia_media"] - base["latencia_media"]
+        print(f"{nome:<12} {resultado['throughput']:>10.2f} {ganho:>+8.0%} "
+              f"{resultado['latencia_media']:>12.2f}s {atraso:>+10.2f}s "
+              f"{resultado['latencia_p95']:>7.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,13 @@
 main.py - Aplicação principal modular
 """
 
-import sys
 import time
+
+# Marca de início do processo, antes dos imports pesados (Qt e módulos locais):
+# a abertura da janela é medida a partir daqui
+INICIO_PROCESSO = time.perf_counter()
+
+import sys
 import random
 from collections import deque
 
@@ -12,15 +17,16 @@ from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QListWidget, QSplitter
 )
-from PySide6.QtCore import QThreadPool, QMutex
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont
 
 # Imports dos módulos locais
 from styles import Estilos, EstilosEspecificos
-from worker import Worker, TaskManager
+from worker import TaskManager
+from cozinha import Cozinha, percentil
 from components import (
     PainelCozinheiro, PainelConfiguracoes, PainelControles,
-    PainelMetricas, PainelLog, PainelDicas
+    PainelMetricas, PainelCozinhasRemotas, PainelLog, PainelDicas
 )
 
 class CozinhaSimulator(QMainWindow):
@@ -28,17 +34,73 @@ class CozinhaSimulator(QMainWindow):
     Aplicação principal - Simulador de Cozinha Concorrente vs Sequencial
     """
     
-    def __init__(self):
+    def __init__(self, inicio_processo=None):
         super().__init__()
-        self.thread_pool = QThreadPool()
-        self.mutex = QMutex()
+        self.cozinha = None
+        self.controlador_elastico = None
+        self.coordenador = None
+        self.configuracao_execucao = None
         self.timer_inicio = None
         self.fila_de_tarefas = deque()
-        
-        self._setup_window()
-        self._setup_ui()
-        self._conectar_eventos()
-        self._carregar_tarefas_inicial()
+        self.painel_remotas = None
+        self.painel_dicas = None
+        
+        # Instrumentação da inicialização (ms por etapa)
+        self.tempos_inicializacao = {}
+        self._inicio_construcao = time.perf_counter()
+        self._inicio_processo = inicio_processo
+        self._inicializacao_concluida = False
+        
+        self._medir_etapa("estilos", self._setup_window)
+        self._medir_etapa("interface", self._setup_ui)
+        self._medir_etapa("eventos", self._conectar_eventos)
+        # O que não é necessário para o primeiro desenho só roda depois da
+        # primeira pintura (ver paintEvent)
+
+    def _medir_etapa(self, etapa, funcao):
+        """Executa uma etapa da inicialização registrando quanto ela levou"""
+        inicio = time.perf_counter()
+        funcao()
+        self.tempos_inicializacao[etapa] = (time.perf_counter() - inicio) * 1000
+
+    def paintEvent(self, evento):
+        """Na primeira pintura registra o tempo e agenda a segunda fase da inicialização"""
+        super().paintEvent(evento)
+        if "primeira_pintura" in self.tempos_inicializacao:
+            return
+        agora = time.perf_counter()
+        self.tempos_inicializacao["primeira_pintura"] = (agora - self._inicio_construcao) * 1000
+        if self._inicio_processo is not None:
+            self.tempos_inicializacao["primeira_pintura_processo"] = (
+                (agora - self._inicio_processo) * 1000
+            )
+        # O timer só dispara depois que o repaint atual termina e vai para a tela
+        QTimer.singleShot(0, self, self.concluir_inicializacao)
+
+    def concluir_inicializacao(self):
+        """
+        Segunda fase da inicialização, agendada pela primeira pintura: carrega
+        a fila inicial e cria os painéis secundários. Pode ser chamada antes do
+        laço de eventos (ex.: benchmarks); só roda uma vez.
+        """
+        if self._inicializacao_concluida:
+            return
+        self._inicializacao_concluida = True
+        
+        self._medir_etapa("fila_inicial", self._carregar_tarefas_inicial)
+        self._medir_etapa("paineis_secundarios", self._criar_paineis_secundarios)
+        
+        tempos = self.tempos_inicializacao
+        pintura = tempos.get("primeira_pintura")
+        janela = f"pintada em {pintura:.0f} ms" if pintura is not None else "montada"
+        if "primeira_pintura_processo" in tempos:
+            janela += f" ({tempos['primeira_pintura_processo']:.0f} ms desde o início do processo)"
+        self.painel_log.adicionar_mensagem(
+            f"⚡ Janela {janela} "
+            f"(estilos {tempos['estilos']:.0f} ms, interface {tempos['interface']:.0f} ms) • "
+            f"fila {tempos['fila_inicial']:.0f} ms • "
+            f"painéis secundários {tempos['paineis_secundarios']:.0f} ms"
+        )
 
     def _setup_window(self):
         """Configurações básicas da janela"""
@@ -89,22 +151,33 @@ class CozinhaSimulator(QMainWindow):
     def _criar_lado_direito(self):
         """Cria o painel direito com métricas e logs"""
         widget = QWidget()
-        layout = QVBoxLayout(widget)
+        self.layout_direito = QVBoxLayout(widget)
         
         # Métricas
         self.painel_metricas = PainelMetricas()
-        layout.addWidget(self.painel_metricas)
+        self.layout_direito.addWidget(self.painel_metricas)
         
         # Log
         self.painel_log = PainelLog()
-        layout.addWidget(self.painel_log)
-        
-        # Dicas
-        self.painel_dicas = PainelDicas()
-        layout.addWidget(self.painel_dicas)
+        self.layout_direito.addWidget(self.painel_log)
         
+        # Cozinhas remotas e dicas são criadas depois (_criar_paineis_secundarios)
         return widget
 
+    def _criar_paineis_secundarios(self):
+        """Painéis que não precisam estar prontos no primeiro desenho da janela"""
+        self.painel_dicas = PainelDicas()
+        self.layout_direito.addWidget(self.painel_dicas)
+
+    def _garantir_painel_remotas(self):
+        """Cria a tabela de cozinhas remotas no primeiro uso do modo distribuído"""
+        if self.painel_remotas is None:
+            self.painel_remotas = PainelCozinhasRemotas()
+            # Logo acima do log
+            indice = self.layout_direito.indexOf(self.painel_log)
+            self.layout_direito.insertWidget(indice, self.painel_remotas)
+        self.painel_remotas.show()
+
     def _adicionar_cabecalho(self, layout):
         """Adiciona título e explicação"""
         titulo = QLabel("<center><h2>🏭 Simulação de Cozinha Industrial</h2></center>")
@@ -125,19 +198,40 @@ class CozinhaSimulator(QMainWindow):
         from PySide6.QtWidgets import QGroupBox
         
         cozinheiros_group = QGroupBox("👥 Equipe de Cozinheiros")
-        layout_cozinheiros = QHBoxLayout(cozinheiros_group)
+        self.layout_cozinheiros = QHBoxLayout(cozinheiros_group)
         
         self.cozinheiros = [
             PainelCozinheiro("Chef Principal", "👨‍🍳"),
             PainelCozinheiro("Sous Chef", "👩‍🍳"), 
             PainelCozinheiro("Cozinheiro Jr", "🧑‍🍳")
         ]
+        self.num_cozinheiros_fixo = len(self.cozinheiros)
         
         for cozinheiro in self.cozinheiros:
-            layout_cozinheiros.addWidget(cozinheiro)
+            self.layout_cozinheiros.addWidget(cozinheiro)
         
         layout.addWidget(cozinheiros_group)
 
+    def _garantir_painel(self, id_cozinheiro):
+        """Cria painéis extras sob demanda (pool elástico) e mostra o do cozinheiro"""
+        while len(self.cozinheiros) <= id_cozinheiro:
+            painel = PainelCozinheiro(f"Cozinheiro {len(self.cozinheiros) + 1}", "🧑‍🍳")
+            self.cozinheiros.append(painel)
+            self.layout_cozinheiros.addWidget(painel)
+        self.cozinheiros[id_cozinheiro].show()
+
+    def _mostrar_especialidades(self, visivel):
+        """Mostra (ou esconde) as especialidades em cada painel"""
+        for id_cozinheiro, painel in enumerate(self.cozinheiros):
+            painel.set_especialidades(TaskManager.especialidades(id_cozinheiro) if visivel else [])
+
+    def _mostrar_cozinheiros(self, quantidade):
+        """Mostra apenas os primeiros `quantidade` painéis"""
+        for id_cozinheiro in range(quantidade):
+            self._garantir_painel(id_cozinheiro)
+        for painel in self.cozinheiros[quantidade:]:
+            painel.hide()
+
     def _adicionar_fila_pedidos(self, layout):
         """Adiciona a fila de pedidos"""
         from PySide6.QtWidgets import QGroupBox
@@ -155,7 +249,8 @@ class CozinhaSimulator(QMainWindow):
         """Conecta os eventos da interface"""
         self.painel_controles.conectar_eventos(
             self.executar_sequencial,
-            self.executar_concorrente
+            self.executar_concorrente,
+            self.executar_distribuido
         )
         
         # Conecta o limpar log para resetar contadores também
@@ -180,9 +275,8 @@ class CozinhaSimulator(QMainWindow):
         num_pedidos = self.painel_config.get_num_pedidos()
         tarefas = TaskManager.gerar_lista_tarefas(num_pedidos)
         
-        for tarefa in tarefas:
-            self.lista_tarefas.addItem(tarefa)
-            self.fila_de_tarefas.append(tarefa)
+        self.lista_tarefas.addItems(tarefas)
+        self.fila_de_tarefas.extend(tarefas)
 
     def _preparar_execucao(self, modo):
         """Prepara a interface para início da execução"""
@@ -192,30 +286,70 @@ class CozinhaSimulator(QMainWindow):
         for cozinheiro in self.cozinheiros:
             cozinheiro.resetar()
             
+        self.configuracao_execucao = self._configuracao_execucao(modo)
         self.painel_log.adicionar_mensagem(f"🚀 INICIANDO MODO {modo}")
         self.painel_log.adicionar_mensagem(f"📋 {self.painel_config.get_num_pedidos()} pedidos na fila")
 
-    def _finalizar_execucao(self, modo, pedidos_processados):
+    def _configuracao_execucao(self, modo):
+        """Parâmetros que mudam o throughput além do paralelismo (chave do speedup)"""
+        config = self.painel_config
+        configuracao = {
+            "pedidos": config.get_num_pedidos(),
+            "tempo_base": config.get_tempo_base(),
+        }
+        if modo in ("SEQUENCIAL", "DISTRIBUÍDO"):
+            # Esses modos não passam pela Cozinha: fila simples, sem preparo nem especialidades
+            configuracao.update(politica="fifo", fator_preparo=0.0, fator_especialidade=1.0)
+            return configuracao
+        configuracao.update(
+            politica=config.get_politica(),
+            fator_preparo=config.get_fator_preparo(),
+            fator_especialidade=config.get_fator_especialidade(),
+        )
+        if configuracao["politica"] == "lotes":
+            configuracao["lote_maximo"] = config.get_lote_maximo()
+        return configuracao
+
+    def _finalizar_execucao(self, modo, pedidos_processados, cozinha=None):
         """Finaliza a execução e atualiza métricas"""
         tempo_total = time.time() - self.timer_inicio
         
         self.painel_controles.habilitar_botoes(True)
         
         # Atualizar métricas
-        self.painel_metricas.atualizar_metricas(tempo_total, pedidos_processados, modo)
+        self.painel_metricas.atualizar_metricas(tempo_total, pedidos_processados, modo,
+                                                self.configuracao_execucao)
         
         # Log final
         throughput = pedidos_processados / tempo_total if tempo_total > 0 else 0
         self.painel_log.adicionar_mensagem(f"🏁 {modo} FINALIZADO!")
         self.painel_log.adicionar_mensagem(f"📊 {pedidos_processados} pedidos em {tempo_total:.1f}s")
         self.painel_log.adicionar_mensagem(f"🚀 Throughput: {throughput:.1f} pedidos/segundo")
+        if cozinha is not None and cozinha.latencias:
+            latencias = cozinha.latencias
+            media = sum(latencias) / len(latencias)
+            self.painel_log.adicionar_mensagem(
+                f"⏳ Latência por pedido: média {media:.1f}s, p95 {percentil(latencias, 95):.1f}s"
+            )
+            self.painel_log.adicionar_mensagem(
+                f"🎯 Estação quente em {cozinha.taxa_acerto_estacao():.0%} dos despachos "
+                f"[{cozinha.selecao.nome}]"
+            )
         self.painel_log.adicionar_mensagem("─" * 50)
 
     # ==================== EXECUÇÃO SEQUENCIAL ====================
     
     def executar_sequencial(self):
-        """Executa as tarefas de forma sequencial (bloqueia a UI)"""
+        """Executa as tarefas de forma sequencial"""
+        if self.painel_config.get_sequencial_justo():
+            self._executar_com_cozinha("SEQUENCIAL (1 WORKER)", 1)
+        else:
+            self._executar_sequencial_bloqueante()
+
+    def _executar_sequencial_bloqueante(self):
+        """Executa as tarefas na thread da UI (bloqueia a UI, para demonstração)"""
         self._preparar_execucao("SEQUENCIAL")
+        self._mostrar_cozinheiros(self.num_cozinheiros_fixo)
         self.timer_inicio = time.time()
         
         cozinheiro_painel = self.cozinheiros[0]  # Apenas o primeiro trabalha
@@ -250,46 +384,162 @@ class CozinhaSimulator(QMainWindow):
     
     def executar_concorrente(self):
         """Executa as tarefas de forma concorrente (UI livre)"""
-        self._preparar_execucao("CONCORRENTE")
+        if self.painel_config.get_elastico():
+            minimo, maximo = self.painel_config.get_limites_elastico()
+            self._executar_com_cozinha("CONCORRENTE", minimo, maximo)
+        else:
+            self._executar_com_cozinha("CONCORRENTE", self.num_cozinheiros_fixo)
+
+    def _executar_com_cozinha(self, modo, num_cozinheiros, maximo_elastico=None):
+        """
+        Executa pelo núcleo de despacho (Worker + QThreadPool). Com um só
+        cozinheiro vira a linha de base sequencial justa: mesma instrumentação,
+        só muda o paralelismo.
+        """
+        self._preparar_execucao(modo)
         self.timer_inicio = time.time()
+        self._mostrar_cozinheiros(num_cozinheiros)
+        
+        # Políticas de despacho e pool elástico só são carregados quando usados
+        from roteamento import criar_selecao
+        
+        cozinha = Cozinha(
+            num_cozinheiros, self.painel_config.get_tempo_base(),
+            fator_preparo=self.painel_config.get_fator_preparo(),
+            selecao=criar_selecao(self.painel_config.get_politica(),
+                                  self.painel_config.get_lote_maximo()),
+            fator_especialidade=self.painel_config.get_fator_especialidade(),
+        )
+        self._conectar_cozinha(cozinha, modo)
+        self._mostrar_especialidades(cozinha.fator_especialidade < 1.0)
+        cozinha.carregar_tarefas(self.fila_de_tarefas)
+        self.fila_de_tarefas.clear()
+        
+        self.controlador_elastico = None
+        if maximo_elastico is not None:
+            from elastico import ControladorElastico
+            self.controlador_elastico = ControladorElastico(
+                cozinha, num_cozinheiros, maximo_elastico,
+                cooldown=self.painel_config.get_tempo_base()
+            )
+            self.controlador_elastico.decisao.connect(self.painel_log.adicionar_mensagem)
+            self.controlador_elastico.iniciar()
         
         # Inicia despachando para todos os cozinheiros
-        for id_cozinheiro in range(len(self.cozinheiros)):
-            self._despachar_proxima_tarefa(id_cozinheiro)
+        cozinha.iniciar()
 
-    def _despachar_proxima_tarefa(self, id_cozinheiro):
-        """Despacha a próxima tarefa para um cozinheiro específico"""
-        self.mutex.lock()
-        
-        if not self.fila_de_tarefas:
-            self.mutex.unlock()
-            if self.thread_pool.activeThreadCount() == 0:
-                self._finalizar_execucao("CONCORRENTE", self.painel_config.get_num_pedidos())
+    def _conectar_cozinha(self, cozinha, modo):
+        """Liga os sinais do núcleo de despacho à interface"""
+        self.cozinha = cozinha
+        cozinha.tarefa_despachada.connect(self._tarefa_despachada)
+        cozinha.tarefa_concluida.connect(self._tarefa_concluida)
+        cozinha.cozinheiro_adicionado.connect(self._cozinheiro_adicionado)
+        cozinha.cozinheiro_retirado.connect(self._cozinheiro_retirado)
+        cozinha.execucao_finalizada.connect(
+            lambda pedidos, _tempo: self._finalizar_execucao(modo, pedidos, cozinha)
+        )
+
+    def _remover_da_lista(self, nome_tarefa):
+        """Tira um pedido da fila visual (lotes podem sair do meio da fila)"""
+        for item in self.lista_tarefas.findItems(nome_tarefa, Qt.MatchExactly):
+            self.lista_tarefas.takeItem(self.lista_tarefas.row(item))
             return
 
-        nome_tarefa = self.fila_de_tarefas.popleft()
-        self.mutex.unlock()
-        
-        self.lista_tarefas.takeItem(0)
-        self.painel_log.adicionar_mensagem(f"👨‍🍳 Cozinheiro {id_cozinheiro+1} iniciou: {nome_tarefa}")
+    def _tarefa_despachada(self, id_cozinheiro, worker):
+        """Atualiza a fila e conecta o worker ao painel do cozinheiro"""
+        for nome_tarefa in worker.tarefas:
+            self._remover_da_lista(nome_tarefa)
+        self.painel_log.adicionar_mensagem(f"👨‍🍳 Cozinheiro {id_cozinheiro+1} iniciou: {worker.nome_tarefa}")
 
-        # Criar e configurar worker
-        worker = Worker(id_cozinheiro, nome_tarefa, self.painel_config.get_tempo_base())
         painel_cozinheiro = self.cozinheiros[id_cozinheiro]
-
-        # Conectar sinais
+        painel_cozinheiro.set_pedidos_em_preparo(len(worker.tarefas))
         worker.sinais.iniciado.connect(painel_cozinheiro.iniciar_tarefa)
         worker.sinais.progresso.connect(painel_cozinheiro.set_progresso)
         worker.sinais.tempo_decorrido.connect(painel_cozinheiro.tarefa_concluida)
-        worker.sinais.concluido.connect(self._tarefa_concluida)
-        
-        self.thread_pool.start(worker)
 
     def _tarefa_concluida(self, id_cozinheiro, nome_tarefa):
         """Callback chamado quando uma tarefa é concluída"""
         self.painel_log.adicionar_mensagem(f"✅ Cozinheiro {id_cozinheiro+1} concluiu: {nome_tarefa}")
         self.cozinheiros[id_cozinheiro].resetar()
-        self._despachar_proxima_tarefa(id_cozinheiro)
+
+    def _cozinheiro_adicionado(self, id_cozinheiro):
+        """Pool elástico: um cozinheiro entrou no turno"""
+        self._garantir_painel(id_cozinheiro)
+        if self.cozinha.fator_especialidade < 1.0:
+            self.cozinheiros[id_cozinheiro].set_especialidades(TaskManager.especialidades(id_cozinheiro))
+        self.cozinheiros[id_cozinheiro].resetar()
+        self.painel_log.adicionar_mensagem(f"➕ Cozinheiro {id_cozinheiro+1} entrou no turno")
+
+    def _cozinheiro_retirado(self, id_cozinheiro):
+        """Pool elástico: um cozinheiro foi dispensado"""
+        self.cozinheiros[id_cozinheiro].hide()
+        self.painel_log.adicionar_mensagem(f"➖ Cozinheiro {id_cozinheiro+1} foi dispensado")
+
+    # ==================== EXECUÇÃO DISTRIBUÍDA ====================
+    
+    def executar_distribuido(self):
+        """Executa as tarefas em processos de cozinha conectados por socket local"""
+        # Importado só aqui: o módulo de rede (QtNetwork, subprocess) não pesa
+        # na abertura da janela de quem nunca usa o modo distribuído
+        from remoto import CoordenadorRemoto
+        
+        self._preparar_execucao("DISTRIBUÍDO")
+        self.timer_inicio = time.time()
+        self._garantir_painel_remotas()
+        
+        coordenador = CoordenadorRemoto(
+            self.painel_config.get_num_cozinhas(),
+            tempo_base=self.painel_config.get_tempo_base(),
+            transporte=self.painel_config.get_transporte(),
+        )
+        self.coordenador = coordenador
+        
+        coordenador.cozinha_conectada.connect(
+            lambda nome: self.painel_log.adicionar_mensagem(f"🔌 {nome} conectada")
+        )
+        coordenador.pedido_despachado.connect(self._pedido_remoto_despachado)
+        coordenador.pedido_devolvido.connect(lambda nome_tarefa: self.lista_tarefas.insertItem(0, nome_tarefa))
+        coordenador.pedido_concluido.connect(
+            lambda cozinha, nome_tarefa, tempo: self.painel_log.adicionar_mensagem(
+                f"✅ {cozinha} concluiu: {nome_tarefa} ({tempo:.1f}s)"
+            )
+        )
+        coordenador.cozinha_caiu.connect(
+            lambda nome, devolvidos: self.painel_log.adicionar_mensagem(
+                f"💥 {nome} caiu! {devolvidos} pedido(s) voltaram para a fila"
+            )
+        )
+        coordenador.cozinha_falhou.connect(
+            lambda nome, motivo: self.painel_log.adicionar_mensagem(f"❌ {nome} {motivo}")
+        )
+        coordenador.execucao_falhou.connect(
+            lambda motivo, restantes: self.painel_log.adicionar_mensagem(
+                f"❌ Execução distribuída falhou: {motivo}; {restantes} pedido(s) não foram feitos"
+            )
+        )
+        coordenador.estatisticas_atualizadas.connect(self._atualizar_cozinhas_remotas)
+        coordenador.execucao_finalizada.connect(
+            lambda pedidos, _tempo: self._finalizar_execucao("DISTRIBUÍDO", pedidos)
+        )
+        
+        self.painel_log.adicionar_mensagem(f"🌐 Coordenador em {coordenador.endereco}")
+        coordenador.iniciar(list(self.fila_de_tarefas))
+        self.fila_de_tarefas.clear()
+
+    def _pedido_remoto_despachado(self, cozinha, nome_tarefa):
+        """Remove o pedido da fila visual e registra no log"""
+        self.lista_tarefas.takeItem(0)
+        self.painel_log.adicionar_mensagem(f"📤 {nome_tarefa} → {cozinha}")
+
+    def _atualizar_cozinhas_remotas(self):
+        """Atualiza a tabela por cozinha e o custo de comunicação"""
+        coordenador = self.coordenador
+        self.painel_remotas.atualizar(coordenador.estatisticas())
+        self.painel_remotas.atualizar_resumo(
+            coordenador.custo_serializacao_us(),
+            coordenador.bytes_enviados,
+            coordenador.bytes_recebidos,
+        )
 
 # ==================== APLICAÇÃO PRINCIPAL ====================
 
@@ -302,7 +552,7 @@ def main():
     app.setFont(fonte)
     
     # Criar e mostrar janela
-    window = CozinhaSimulator()
+    window = CozinhaSimulator(inicio_processo=INICIO_PROCESSO)
     window.show()
     
     return app.exec()
@@ -0,0 +1,492 @@
+# -*- coding: utf-8 -*-
+"""
+remoto.py - "Cozinhas remotas": despacho distribuído entre processos locais
+
+Um coordenador (dentro do processo da janela ou da linha de comando) abre um
+socket local (TCP em 127.0.0.1 ou Unix domain socket) e inicia N processos de
+cozinha. Cada cozinha se conecta, recebe pedidos, devolve progresso e conclusão.
+Se uma cozinha cair, os pedidos que estavam com ela voltam para o início da fila.
+
+Protocolo: uma mensagem JSON por linha.
+    cozinha → coordenador: ola, ack, progresso, concluido
+    coordenador → cozinha: pedido, fim
+
+    python remoto.py --cozinhas 3 --pedidos 30                  # coordenador
+    python remoto.py --cozinhas 3 --transporte unix --derrubar 2
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import socket
+import argparse
+import tempfile
+import threading
+import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, QTimer, QEventLoop, Signal
+from PySide6.QtNetwork import QTcpServer, QHostAddress, QLocalServer
+
+# O servidor "unix" é um QLocalServer; o filho se conecta com AF_UNIX, que
+# não existe em todas as plataformas (no Windows o QLocalServer é um named pipe)
+TRANSPORTES = ("tcp", "unix") if hasattr(socket, "AF_UNIX") else ("tcp",)
+
+# ==================== LADO DA COZINHA (PROCESSO FILHO) ====================
+
+def executar_cozinha(endereco, transporte, nome, capacidade):
+    """Loop de um processo de cozinha: recebe pedidos e cozinha em `capacidade` threads"""
+    if transporte == "unix":
+        conexao = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        conexao.connect(endereco)
+    else:
+        host, porta = endereco.rsplit(":", 1)
+        conexao = socket.create_connection((host, int(porta)))
+
+    trava = threading.Lock()
+
+    def enviar(mensagem):
+        dados = (json.dumps(mensagem) + "\n").encode("utf-8")
+        with trava:
+            conexao.sendall(dados)
+
+    def cozinhar(pedido):
+        inicio = time.time()
+        passos = 10
+        for i in range(1, passos + 1):
+            time.sleep(pedido["tempo"] / passos)
+            enviar({"tipo": "progresso", "id": pedido["id"], "valor": i * 100 // passos})
+        enviar({"tipo": "concluido", "id": pedido["id"], "tempo": time.time() - inicio})
+
+    enviar({"tipo": "ola", "cozinha": nome, "capacidade": capacidade, "pid": os.getpid()})
+
+    with ThreadPoolExecutor(max_workers=capacidade) as executor:
+        for linha in conexao.makefile("r", encoding="utf-8"):
+            mensagem = json.loads(linha)
+            if mensagem["tipo"] == "pedido":
+                # O ack volta na hora: mede serialização + ida e volta no socket
+                enviar({"tipo": "ack", "id": mensagem["id"], "enviado": mensagem["enviado"]})
+                executor.submit(cozinhar, mensagem)
+            elif mensagem["tipo"] == "fim":
+                break
+
+    conexao.close()
+
+# ==================== LADO DO COORDENADOR ====================
+
+class _CozinhaRemota:
+    """Estado que o coordenador mantém sobre cada cozinha conectada"""
+
+    def __init__(self, nome, processo):
+        self.nome = nome
+        self.processo = processo
+        self.conexao = None
+        self.capacidade = 0
+        self.em_andamento = {}   # id do pedido -> nome da tarefa
+        self.progresso = {}      # id do pedido -> 0..100
+        self.concluidos = 0
+        self.rtts = []
+        self.conectada_em = None
+        self.desconectada_em = None
+        self.ativa = False
+        self.falhou = False      # o processo terminou (ou expirou) sem se conectar
+
+    def aguardando_conexao(self):
+        """Processo ainda vivo que não mandou o "ola" (conta como cozinha pendente)"""
+        return self.conectada_em is None and not self.falhou and self.processo.poll() is None
+
+class CoordenadorRemoto(QObject):
+    """
+    Coordenador das cozinhas remotas: distribui pedidos por crédito
+    (cada cozinha recebe até `capacidade` pedidos simultâneos).
+    Os processos são vigiados por um timer: uma cozinha que morre ou não se
+    conecta em `tempo_conexao` segundos é dada como perdida, e a execução
+    falha se sobrarem pedidos sem nenhuma cozinha viva para fazê-los.
+    """
+    cozinha_conectada = Signal(str)
+    cozinha_caiu = Signal(str, int)            # nome, pedidos devolvidos à fila
+    cozinha_falhou = Signal(str, str)          # nome, motivo (nunca chegou a se conectar)
+    pedido_despachado = Signal(str, str)       # cozinha, nome_tarefa
+    pedido_devolvido = Signal(str)             # nome_tarefa
+    pedido_concluido = Signal(str, str, float) # cozinha, nome_tarefa, tempo
+    estatisticas_atualizadas = Signal()
+    execucao_falhou = Signal(str, int)         # motivo, pedidos que ficaram sem fazer
+    execucao_finalizada = Signal(int, float)   # pedidos processados, tempo total
+    processos_encerrados = Signal()
+
+    def __init__(self, num_cozinhas=3, capacidade=1, tempo_base=2.0,
+                 variacao=(0.5, 1.5), transporte="tcp", tempo_conexao=10.0,
+                 tempo_encerramento=5.0, parent=None):
+        super().__init__(parent)
+        self.num_cozinhas = num_cozinhas
+        self.capacidade = capacidade
+        self.tempo_base = tempo_base
+        self.variacao = variacao
+        self.transporte = transporte
+        self.tempo_conexao = tempo_conexao
+        self.tempo_encerramento = tempo_encerramento
+
+        self.cozinhas = {}
+        self.fila_de_tarefas = deque()
+        self.pedidos_processados = 0
+        self.timer_inicio = None
+        self.timer_fim = None
+        self.iniciado_em = None
+        self.finalizado = False
+        self.pedidos_restantes = 0
+        self._prazo_encerramento = None
+        self._proximo_id = 0
+        self._conexoes = {}        # conexão -> _CozinhaRemota (após o "ola")
+        self._buffers = {}
+
+        # Custos de comunicação medidos no coordenador
+        self.tempo_serializacao = 0.0
+        self.mensagens_serializadas = 0
+        self.bytes_enviados = 0
+        self.bytes_recebidos = 0
+
+        self.timer_estatisticas = QTimer(self)
+        self.timer_estatisticas.setInterval(500)
+        self.timer_estatisticas.timeout.connect(self.estatisticas_atualizadas.emit)
+
+        # Vigia os processos sem bloquear a thread da interface
+        self.timer_processos = QTimer(self)
+        self.timer_processos.setInterval(100)
+        self.timer_processos.timeout.connect(self._vigiar_processos)
+
+        self._criar_servidor()
+
+    def _criar_servidor(self):
+        if self.transporte == "unix":
+            self.servidor = QLocalServer(self)
+            self.endereco = os.path.join(tempfile.gettempdir(), f"cozinha-{os.getpid()}-{id(self)}.sock")
+            QLocalServer.removeServer(self.endereco)
+            ok = self.servidor.listen(self.endereco)
+        else:
+            self.servidor = QTcpServer(self)
+            ok = self.servidor.listen(QHostAddress.LocalHost, 0)
+            self.endereco = f"127.0.0.1:{self.servidor.serverPort()}"
+
+        if not ok:
+            raise RuntimeError(f"Não foi possível abrir o socket local: {self.servidor.errorString()}")
+        self.servidor.newConnection.connect(self._nova_conexao)
+
+    # ==================== CICLO DE VIDA ====================
+
+    def iniciar(self, tarefas):
+        """Enfileira as tarefas e inicia os processos de cozinha"""
+        self.fila_de_tarefas.clear()
+        self.fila_de_tarefas.extend(tarefas)
+        self.iniciado_em = time.time()
+
+        for i in range(self.num_cozinhas):
+            nome = f"Cozinha {i + 1}"
+            processo = subprocess.Popen([
+                sys.executable, os.path.abspath(__file__), "cozinha",
+                "--endereco", self.endereco, "--transporte", self.transporte,
+                "--nome", nome, "--capacidade", str(self.capacidade),
+            ])
+            self.cozinhas[nome] = _CozinhaRemota(nome, processo)
+
+        self.timer_estatisticas.start()
+        self.timer_processos.start()
+
+    def derrubar_cozinha(self, nome):
+        """Mata o processo de uma cozinha (para demonstrar o rebalanceamento)"""
+        cozinha = self.cozinhas.get(nome)
+        if cozinha is not None and cozinha.processo.poll() is None:
+            cozinha.processo.kill()
+
+    def encerrar(self):
+        """
+        Avisa as cozinhas que acabou. Os processos são recolhidos pelo timer
+        (mortos após `tempo_encerramento` s); `processos_encerrados` avisa o fim.
+        """
+        self.timer_estatisticas.stop()
+        for cozinha in self.cozinhas.values():
+            if cozinha.ativa:
+                self._enviar(cozinha, {"tipo": "fim"})
+                cozinha.conexao.flush()
+                cozinha.ativa = False
+                cozinha.desconectada_em = self.timer_fim
+        self.servidor.close()
+        self._prazo_encerramento = time.time() + self.tempo_encerramento
+        self.timer_processos.start()
+
+    def aguardar_processos(self):
+        """Roda o loop de eventos até todos os processos terem terminado (linha de comando)"""
+        if self.timer_processos.isActive():
+            loop = QEventLoop()
+            self.processos_encerrados.connect(loop.quit)
+            loop.exec()
+
+    def _vigiar_processos(self):
+        """Detecta cozinhas que morreram antes de conectar e recolhe processos no fim"""
+        agora = time.time()
+        vivos = 0
+        for cozinha in self.cozinhas.values():
+            if cozinha.processo.poll() is None:
+                vivos += 1
+                if self.finalizado:
+                    if agora >= self._prazo_encerramento:
+                        cozinha.processo.kill()
+                elif cozinha.conectada_em is None and agora - self.iniciado_em > self.tempo_conexao:
+                    cozinha.processo.kill()
+                    self._cozinha_perdida(cozinha, "não se conectou a tempo")
+            elif not self.finalizado and cozinha.conectada_em is None and not cozinha.falhou:
+                self._cozinha_perdida(
+                    cozinha, f"terminou antes de conectar (código {cozinha.processo.returncode})"
+                )
+
+        if self.finalizado:
+            if not vivos:
+                self.timer_processos.stop()
+                self.estatisticas_atualizadas.emit()
+                self.processos_encerrados.emit()
+        else:
+            self._verificar_fim()
+
+    def _cozinha_perdida(self, cozinha, motivo):
+        cozinha.falhou = True
+        cozinha.desconectada_em = time.time()
+        self.cozinha_falhou.emit(cozinha.nome, motivo)
+
+    # ==================== CONEXÕES ====================
+
+    def _nova_conexao(self):
+        while self.servidor.hasPendingConnections():
+            conexao = self.servidor.nextPendingConnection()
+            self._buffers[conexao] = b""
+            conexao.readyRead.connect(lambda conexao=conexao: self._ler(conexao))
+            conexao.disconnected.connect(lambda conexao=conexao: self._desconectou(conexao))
+
+    def _ler(self, conexao):
+        dados = bytes(conexao.readAll())
+        self.bytes_recebidos += len(dados)
+        self._buffers[conexao] += dados
+
+        *linhas, resto = self._buffers[conexao].split(b"\n")
+        self._buffers[conexao] = resto
+        for linha in linhas:
+            inicio = time.perf_counter()
+            mensagem = json.loads(linha)
+            self.tempo_serializacao += time.perf_counter() - inicio
+            self.mensagens_serializadas += 1
+            self._tratar_mensagem(conexao, mensagem)
+
+    def _desconectou(self, conexao):
+        cozinha = self._conexoes.pop(conexao, None)
+        self._buffers.pop(conexao, None)
+        if cozinha is None or not cozinha.ativa:
+            return
+        cozinha.ativa = False
+        cozinha.desconectada_em = time.time()
+        if self.finalizado:
+            return
+
+        # Rebalanceamento: os pedidos da cozinha que caiu voltam para o início da fila
+        devolvidos = list(cozinha.em_andamento.values())
+        for nome_tarefa in reversed(devolvidos):
+            self.fila_de_tarefas.appendleft(nome_tarefa)
+            self.pedido_devolvido.emit(nome_tarefa)
+        cozinha.em_andamento.clear()
+        cozinha.progresso.clear()
+
+        self.cozinha_caiu.emit(cozinha.nome, len(devolvidos))
+        self._despachar()
+        self._verificar_fim()
+
+    def _tratar_mensagem(self, conexao, mensagem):
+        tipo = mensagem["tipo"]
+
+        if tipo == "ola":
+            cozinha = self.cozinhas[mensagem["cozinha"]]
+            cozinha.conexao = conexao
+            cozinha.capacidade = mensagem["capacidade"]
+            cozinha.conectada_em = time.time()
+            cozinha.ativa = True
+            self._conexoes[conexao] = cozinha
+            if self.timer_inicio is None:
+                self.timer_inicio = time.time()
+            self.cozinha_conectada.emit(cozinha.nome)
+            self._despachar()
+            return
+
+        cozinha = self._conexoes[conexao]
+        if tipo == "ack":
+            cozinha.rtts.append(time.perf_counter() - mensagem["enviado"])
+        elif tipo == "progresso":
+            if mensagem["id"] in cozinha.em_andamento:
+                cozinha.progresso[mensagem["id"]] = mensagem["valor"]
+        elif tipo == "concluido":
+            nome_tarefa = cozinha.em_andamento.pop(mensagem["id"], None)
+            cozinha.progresso.pop(mensagem["id"], None)
+            if nome_tarefa is None:
+                return
+            cozinha.concluidos += 1
+            self.pedidos_processados += 1
+            self.pedido_concluido.emit(cozinha.nome, nome_tarefa, mensagem["tempo"])
+            self._despachar()
+            self._verificar_fim()
+
+    # ==================== DESPACHO ====================
+
+    def _enviar(self, cozinha, mensagem):
+        inicio = time.perf_counter()
+        dados = (json.dumps(mensagem) + "\n").encode("utf-8")
+        self.tempo_serializacao += time.perf_counter() - inicio
+        self.mensagens_serializadas += 1
+        self.bytes_enviados += len(dados)
+        cozinha.conexao.write(dados)
+
+    def _despachar(self):
+        """Distribui pedidos para as cozinhas com crédito livre (a menos ocupada primeiro)"""
+        while self.fila_de_tarefas:
+            livres = [c for c in self.cozinhas.values()
+                      if c.ativa and len(c.em_andamento) < c.capacidade]
+            if not livres:
+                return
+            cozinha = min(livres, key=lambda c: len(c.em_andamento))
+
+            nome_tarefa = self.fila_de_tarefas.popleft()
+            id_pedido = self._proximo_id
+            self._proximo_id += 1
+            cozinha.em_andamento[id_pedido] = nome_tarefa
+            cozinha.progresso[id_pedido] = 0
+
+            self._enviar(cozinha, {
+                "tipo": "pedido",
+                "id": id_pedido,
+                "nome": nome_tarefa,
+                "tempo": self.tempo_base + random.uniform(*self.variacao),
+                "enviado": time.perf_counter(),
+            })
+            self.pedido_despachado.emit(cozinha.nome, nome_tarefa)
+
+    def _verificar_fim(self):
+        """Termina quando a fila esvaziou ou quando não há mais cozinha viva para esvaziá-la"""
+        if self.finalizado or self.iniciado_em is None:
+            return
+        cozinhas = self.cozinhas.values()
+        if any(c.em_andamento for c in cozinhas):
+            return
+        if self.fila_de_tarefas and any(c.ativa or c.aguardando_conexao() for c in cozinhas):
+            return
+
+        self.finalizado = True
+        self.timer_fim = time.time()
+        tempo_total = self.timer_fim - (self.timer_inicio or self.iniciado_em)
+        self.pedidos_restantes = len(self.fila_de_tarefas)
+        self.encerrar()
+        self.estatisticas_atualizadas.emit()
+        if self.pedidos_restantes:
+            self.execucao_falhou.emit("nenhuma cozinha disponível", self.pedidos_restantes)
+        self.execucao_finalizada.emit(self.pedidos_processados, tempo_total)
+
+    # ==================== MÉTRICAS ====================
+
+    def estatisticas(self):
+        """Resumo por cozinha: status, pedidos, throughput, RTT e progresso"""
+        agora = time.time()
+        linhas = []
+        for cozinha in self.cozinhas.values():
+            if cozinha.ativa:
+                status = "🟢 ativa"
+            elif cozinha.falhou:
+                status = "❌ não conectou"
+            elif cozinha.conectada_em is None:
+                status = "⏳ conectando"
+            elif cozinha.processo.returncode is None:
+                status = "⏹️ encerrando" if self.finalizado else "🔴 caiu"
+            elif cozinha.processo.returncode == 0:
+                status = "🏁 encerrada"
+            else:
+                status = "🔴 caiu"
+
+            fim = cozinha.desconectada_em or agora
+            decorrido = fim - cozinha.conectada_em if cozinha.conectada_em else 0
+            progresso = cozinha.progresso.values()
+            linhas.append({
+                "cozinha": cozinha.nome,
+                "status": status,
+                "em_preparo": len(cozinha.em_andamento),
+                "progresso": sum(progresso) / len(progresso) if progresso else 0,
+                "concluidos": cozinha.concluidos,
+                "throughput": cozinha.concluidos / decorrido if decorrido > 0 else 0,
+                "rtt_ms": sum(cozinha.rtts) / len(cozinha.rtts) * 1000 if cozinha.rtts else 0,
+            })
+        return linhas
+
+    def custo_serializacao_us(self):
+        """Tempo médio de (de)serialização por mensagem no coordenador (µs)"""
+        if not self.mensagens_serializadas:
+            return 0.0
+        return self.tempo_serializacao / self.mensagens_serializadas * 1e6
+
+# ==================== LINHA DE COMANDO ====================
+
+def _executar_coordenador(args):
+    from worker import TaskManager
+    from cozinha import garantir_aplicacao, aguardar_finalizacao
+
+    app = garantir_aplicacao()
+    coordenador = CoordenadorRemoto(args.cozinhas, args.capacidade, args.tempo_base,
+                                    (0, args.variacao), args.transporte, args.tempo_conexao)
+    coordenador.cozinha_conectada.connect(lambda nome: print(f"🔌 {nome} conectada"))
+    coordenador.cozinha_caiu.connect(
+        lambda nome, devolvidos: print(f"💥 {nome} caiu; {devolvidos} pedido(s) voltaram para a fila")
+    )
+    coordenador.cozinha_falhou.connect(lambda nome, motivo: print(f"❌ {nome} {motivo}"))
+    coordenador.execucao_falhou.connect(
+        lambda motivo, restantes: print(f"❌ Execução falhou: {motivo}; {restantes} pedido(s) não foram feitos")
+    )
+    if args.derrubar:
+        QTimer.singleShot(int(args.derrubar_apos * 1000),
+                          lambda: coordenador.derrubar_cozinha(f"Cozinha {args.derrubar}"))
+
+    print(f"🌐 Coordenador em {coordenador.endereco} ({args.transporte})")
+    resultado = aguardar_finalizacao(
+        coordenador, lambda: coordenador.iniciar(TaskManager.gerar_lista_tarefas(args.pedidos))
+    )
+    coordenador.aguardar_processos()
+
+    tempo_total = resultado["tempo_total"]
+    throughput = resultado["pedidos"] / tempo_total if tempo_total > 0 else 0
+    print(f"\n📊 {resultado['pedidos']} pedidos em {tempo_total:.2f}s ({throughput:.2f} pedidos/s)")
+    print(f"{'cozinha':<12} {'status':<14} {'pedidos':>8} {'pedidos/s':>10} {'RTT méd':>10}")
+    for linha in coordenador.estatisticas():
+        print(f"{linha['cozinha']:<12} {linha['status']:<14} {linha['concluidos']:>8} "
+              f"{linha['throughput']:>10.2f} {linha['rtt_ms']:>8.2f}ms")
+    print(f"🧾 Serialização: {coordenador.custo_serializacao_us():.1f} µs/mensagem, "
+          f"{coordenador.bytes_enviados} B enviados, {coordenador.bytes_recebidos} B recebidos")
+    return 1 if coordenador.pedidos_restantes else 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Cozinhas remotas em processos locais")
+    parser.add_argument("papel", nargs="?", choices=("coordenador", "cozinha"), default="coordenador")
+    parser.add_argument("--transporte", choices=TRANSPORTES, default="tcp")
+    # Coordenador
+    parser.add_argument("--cozinhas", type=int, default=3)
+    parser.add_argument("--capacidade", type=int, default=1, help="cozinheiros por cozinha")
+    parser.add_argument("--pedidos", type=int, default=20)
+    parser.add_argument("--tempo-base", type=float, default=0.5)
+    parser.add_argument("--variacao", type=float, default=0.2)
+    parser.add_argument("--derrubar", type=int, default=0, help="número da cozinha a derrubar")
+    parser.add_argument("--derrubar-apos", type=float, default=1.5, help="segundos até derrubar")
+    parser.add_argument("--tempo-conexao", type=float, default=10.0,
+                        help="segundos para cada cozinha se conectar antes de ser dada como perdida")
+    # Cozinha
+    parser.add_argument("--endereco")
+    parser.add_argument("--nome", default="Cozinha")
+    args = parser.parse_args()
+
+    if args.papel == "cozinha":
+        executar_cozinha(args.endereco, args.transporte, args.nome, args.capacidade)
+        return 0
+    return _executar_coordenador(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
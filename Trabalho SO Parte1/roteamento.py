@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+roteamento.py - Roteamento por afinidade (estação quente) e especialidades
+
+Cada cozinheiro lembra o último prato que fez: repetir o prato dispensa o
+preparo da estação (como um cache já aquecido). O roteador faz o cozinheiro
+livre procurar, entre os primeiros pedidos da fila, um prato para o qual a
+estação dele já está quente; depois uma especialidade dele; e só então
+"rouba" qualquer pedido, para ninguém ficar ocioso com fila cheia.
+
+    python roteamento.py --pedidos 40 --cozinheiros 3
+"""
+
+import sys
+import argparse
+
+from worker import TaskManager
+from cozinha import SelecaoFifo
+from lotes import AgrupadorLotes
+
+class RoteadorAfinidade:
+    """
+    Política de seleção da Cozinha orientada a afinidade.
+    Olha só os `janela` primeiros pedidos; se o mais antigo já esperou
+    `espera_maxima` segundos, ele sai na frente (evita inanição).
+    Cada escolha cai em exatamente um contador: acertos, especialidades,
+    roubos ou inanicao.
+    """
+
+    nome = "afinidade"
+
+    def __init__(self, janela=8, espera_maxima=None):
+        self.janela = janela
+        self.espera_maxima = espera_maxima
+        self.acertos = 0
+        self.especialidades = 0
+        self.roubos = 0
+        self.inanicao = 0
+
+    @property
+    def escolhas(self):
+        """Total de escolhas feitas (deve bater com os despachos da cozinha)"""
+        return self.acertos + self.especialidades + self.roubos + self.inanicao
+
+    def escolher(self, cozinha, id_cozinheiro):
+        """Estação quente > especialidade livre > qualquer pedido livre > frente da fila"""
+        if self.espera_maxima is not None and cozinha.espera_mais_antiga() >= self.espera_maxima:
+            self.inanicao += 1
+            return [0], None
+
+        limite = min(self.janela, len(cozinha.fila_de_tarefas))
+        pratos = [TaskManager.extrair_prato(cozinha.fila_de_tarefas[i]) for i in range(limite)]
+
+        quente = cozinha.ultimo_prato.get(id_cozinheiro)
+        if quente in pratos:
+            self.acertos += 1
+            return [pratos.index(quente)], None
+
+        # Não tira de outro cozinheiro um prato para o qual a estação dele está quente
+        quentes_outros = {
+            prato for outro, prato in cozinha.ultimo_prato.items()
+            if outro != id_cozinheiro and outro in cozinha.ativos
+        }
+        especialidades = TaskManager.especialidades(id_cozinheiro)
+        for indice, prato in enumerate(pratos):
+            if prato in especialidades and prato not in quentes_outros:
+                self.especialidades += 1
+                return [indice], None
+        # Sem estação quente nem especialidade: "rouba" qualquer pedido, de
+        # preferência um que não esteja quente para outro cozinheiro
+        self.roubos += 1
+        for indice, prato in enumerate(pratos):
+            if prato not in quentes_outros:
+                return [indice], None
+        return [0], None
+
+POLITICAS_SELECAO = {
+    SelecaoFifo.nome: SelecaoFifo,
+    AgrupadorLotes.nome: AgrupadorLotes,
+    RoteadorAfinidade.nome: RoteadorAfinidade,
+}
+
+def criar_selecao(nome, lote_maximo=4, atraso_maximo=0.0):
+    """Cria a política de seleção pelo nome ("fifo", "lotes" ou "afinidade")"""
+    if nome == AgrupadorLotes.nome:
+        return AgrupadorLotes(lote_maximo, atraso_maximo)
+    return POLITICAS_SELECAO[nome]()
+
+# ==================== COMPARAÇÃO SEM INTERFACE ====================
+
+def main():
+    from cozinha import executar_headless
+
+    parser = argparse.ArgumentParser(description="FIFO vs roteamento por afinidade")
+    parser.add_argument("--cozinheiros", type=int, default=3)
+    parser.add_argument("--pedidos", type=int, default=40)
+    parser.add_argument("--janela", type=int, default=8, help="pedidos examinados pelo roteador")
+    parser.add_argument("--espera-maxima", type=float, default=None,
+                        help="espera (s) a partir da qual o pedido mais antigo sai na frente")
+    parser.add_argument("--tempo-base", type=float, default=0.2)
+    parser.add_argument("--fator-preparo", type=float, default=0.5)
+    parser.add_argument("--fator-especialidade", type=float, default=0.7)
+    args = parser.parse_args()
+
+    tarefas = TaskManager.gerar_lista_tarefas(args.pedidos)
+    parametros = dict(tempo_base=args.tempo_base, variacao=(0, 0.1), passos=10,
+                      fator_preparo=args.fator_preparo,
+                      fator_especialidade=args.fator_especialidade)
+
+    fifo = executar_headless(args.cozinheiros, tarefas, **parametros)
+    roteador = RoteadorAfinidade(args.janela, args.espera_maxima)
+    afinidade = executar_headless(args.cozinheiros, tarefas, selecao=roteador, **parametros)
+
+    print(f"{'política':<10} {'pedidos/s':>10} {'acerto estação':>15} "
+          f"{'latência méd':>13} {'p95':>8}")
+    for nome, resultado in (("fifo", fifo), ("afinidade", afinidade)):
+        print(f"{nome:<10} {resultado['throughput']:>10.2f} "
+              f"{resultado['taxa_acerto_estacao']:>15.0%} "
+              f"{resultado['latencia_media']:>12.2f}s {resultado['latencia_p95']:>7.2f}s")
+
+    ganho = afinidade["throughput"] / fifo["throughput"] - 1 if fifo["throughput"] else 0
+    print(f"\n🚀 Ganho de throughput: {ganho:+.0%}")
+    if roteador.escolhas != afinidade["despachos"]:
+        print(f"⚠️ Contadores do roteador ({roteador.escolhas}) não batem com "
+              f"os despachos ({afinidade['despachos']})")
+        return 1
+    print(f"🎯 Roteador em {roteador.escolhas} despachos: {roteador.acertos} estação quente, "
+          f"{roteador.especialidades} especialidade, {roteador.roubos} roubo(s), "
+          f"{roteador.inanicao} por inanição")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
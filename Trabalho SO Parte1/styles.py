@@ -23,6 +23,8 @@ class Cores:
     BOTAO_SEQUENCIAL_HOVER = "#e60707"  # Primary mais escuro
     BOTAO_CONCORRENTE = ACCENT
     BOTAO_CONCORRENTE_HOVER = "#e6a800"  # Accent mais escuro
+    BOTAO_DISTRIBUIDO = SECONDARY
+    BOTAO_DISTRIBUIDO_HOVER = "#e48585"  # Secondary mais escuro
     BOTAO_DESABILITADO = "#5d5d5d"
     
     PROGRESSO_BAR = SECONDARY
@@ -49,23 +51,12 @@ class Estilos:
     def get_painel_cozinheiro_style():
         return f"""
         QFrame#PainelCozinheiro {{
-            border: 3px solid {Cores.PAINEL_NORMAL};
-            border-radius: 12px;
-            background-color: {Cores.PAINEL_NORMAL};
+            border: 3px solid transparent;
+            background-color: transparent;
             margin: 5px;
             padding: 15px;
             color: {Cores.TEXTO_PRINCIPAL};
         }}
-        QFrame#PainelCozinheiro[status="trabalhando"] {{
-            border: 3px solid {Cores.ACCENT};
-            background-color: {Cores.PAINEL_TRABALHANDO};
-            color: {Cores.BACKGROUND};
-        }}
-        QFrame#PainelCozinheiro[status="aguardando"] {{
-            border: 3px solid {Cores.BOTAO_DESABILITADO};
-            background-color: {Cores.PAINEL_AGUARDANDO};
-            color: {Cores.TEXT};
-        }}
         """
     
     @staticmethod
@@ -94,6 +85,13 @@ class Estilos:
         QPushButton#concorrente:hover {{
             background-color: {Cores.BOTAO_CONCORRENTE_HOVER};
         }}
+        QPushButton#distribuido {{
+            background-color: {Cores.BOTAO_DISTRIBUIDO};
+            border: 2px solid {Cores.BOTAO_DISTRIBUIDO_HOVER};
+        }}
+        QPushButton#distribuido:hover {{
+            background-color: {Cores.BOTAO_DISTRIBUIDO_HOVER};
+        }}
         QPushButton:disabled {{
             background-color: {Cores.BOTAO_DESABILITADO};
             color: {Cores.SECONDARY};
@@ -104,7 +102,7 @@ class Estilos:
     @staticmethod
     def get_list_and_progress_style():
         return f"""
-        QListWidget {{
+        QListWidget, QTableWidget {{
             font-size: 13px;
             border: 2px solid {Cores.PAINEL_NORMAL};
             border-radius: 8px;
@@ -179,6 +177,14 @@ class Estilos:
 # Estilos específicos para componentes individuais
 class EstilosEspecificos:
     
+    # Estilo do rótulo de status do cozinheiro, pré-calculado por estado
+    # Borda e fundo do PainelCozinheiro são pintados pelo próprio painel
+    # (ver PainelCozinheiro.paintEvent); o texto vai na cor do status
+    STATUS_COZINHEIRO = {
+        "trabalhando": {"borda": Cores.ACCENT, "fundo": Cores.PAINEL_TRABALHANDO, "texto": "#28a745"},
+        "aguardando": {"borda": Cores.BOTAO_DESABILITADO, "fundo": Cores.PAINEL_AGUARDANDO, "texto": "#6c757d"},
+    }
+    
     TITULO_PRINCIPAL = f"color: {Cores.TEXTO_PRINCIPAL}; margin: 10px; font-weight: bold;"
     
     EXPLICACAO_BOX = f"""
@@ -215,7 +221,9 @@ class EstilosEspecificos:
         <b style='color: {Cores.PRIMARY};'>🔴 Modo Sequencial:</b><br>
         • Tente mover a janela durante execução<br>
         • Note que TUDO trava<br>
-        • Apenas 1 cozinheiro trabalha<br><br>
+        • Apenas 1 cozinheiro trabalha<br>
+        • Marque "Sequencial justo" para rodar com 1 worker no<br>
+        &nbsp;&nbsp;mesmo executor e comparar só o paralelismo<br><br>
         
         <b style='color: {Cores.ACCENT};'>🟢 Modo Concorrente:</b><br>
         • Interface permanece responsiva<br>
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+varredura.py - Varredura de parâmetros com curvas de escalabilidade
+
+Roda, sem janela, todas as combinações de número de cozinheiros, número de
+pedidos, tempo base, tipo de carga e política de despacho. Cada execução é
+independente e vai para um processo separado. Gera uma tabela (CSV), gráficos
+de throughput e eficiência (se o matplotlib estiver instalado) e aponta a
+partir de quantos cozinheiros adicionar mais gente deixa de compensar.
+
+    python varredura.py --cozinheiros 1 2 4 6 8 --politica fifo afinidade
+"""
+
+import os
+import csv
+import random
+import argparse
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from worker import TaskManager
+from roteamento import POLITICAS_SELECAO
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Parâmetros que definem uma curva (tudo menos o número de cozinheiros)
+CHAVES_CURVA = ("pedidos", "tempo_base", "carga", "politica")
+
+def executar_combinacao(parametros):
+    """Executa uma combinação em um processo próprio e devolve a linha da tabela"""
+    from cozinha import executar_headless
+    from roteamento import criar_selecao
+
+    # Mesma semente para a mesma carga: todas as contagens de cozinheiros
+    # recebem exatamente os mesmos pedidos
+    random.seed(f"{parametros['semente']}-{parametros['pedidos']}-{parametros['carga']}")
+    tarefas = TaskManager.gerar_carga(parametros["pedidos"], parametros["carga"])
+
+    resultado = executar_headless(
+        parametros["cozinheiros"], tarefas,
+        tempo_base=parametros["tempo_base"],
+        variacao=(0, parametros["tempo_base"] * 0.2),
+        passos=10,
+        fator_preparo=parametros["fator_preparo"],
+        fator_especialidade=parametros["fator_especialidade"],
+        selecao=criar_selecao(parametros["politica"], parametros["lote_maximo"]),
+    )
+
+    linha = {chave: parametros[chave] for chave in ("cozinheiros",) + CHAVES_CURVA}
+    for chave in ("tempo_total", "throughput", "latencia_media", "latencia_p95",
+                  "taxa_acerto_estacao"):
+        linha[chave] = resultado[chave]
+    return linha
+
+def gerar_combinacoes(args):
+    combinacoes = []
+    for cozinheiros, pedidos, tempo_base, carga, politica in itertools.product(
+            args.cozinheiros, args.pedidos, args.tempo_base, args.carga, args.politica):
+        combinacoes.append({
+            "cozinheiros": cozinheiros,
+            "pedidos": pedidos,
+            "tempo_base": tempo_base,
+            "carga": carga,
+            "politica": politica,
+            "lote_maximo": args.lote_maximo,
+            "fator_preparo": args.fator_preparo,
+            "fator_especialidade": args.fator_especialidade,
+            "semente": args.semente,
+        })
+    return combinacoes
+
+def executar_varredura(combinacoes, processos):
+    """Distribui as combinações entre processos (spawn: cada um com seu Qt)"""
+    if processos <= 1:
+        return [executar_combinacao(parametros) for parametros in combinacoes]
+
+    contexto = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=processos, mp_context=contexto) as executor:
+        return list(executor.map(executar_combinacao, combinacoes))
+
+# ==================== ANÁLISE ====================
+
+def agrupar_curvas(linhas):
+    """Agrupa as linhas por curva, ordenadas pelo número de cozinheiros"""
+    curvas = {}
+    for linha in linhas:
+        chave = tuple(linha[c] for c in CHAVES_CURVA)
+        curvas.setdefault(chave, []).append(linha)
+    for pontos in curvas.values():
+        pontos.sort(key=lambda linha: linha["cozinheiros"])
+    return curvas
+
+def calcular_escalabilidade(curvas):
+    """
+    Acrescenta speedup e eficiência (relativos ao menor número de cozinheiros
+    da curva) e o ganho marginal por cozinheiro em relação ao ponto anterior
+    """
+    for pontos in curvas.values():
+        base = pontos[0]
+        anterior = None
+        for linha in pontos:
+            if base["throughput"]:
+                linha["speedup"] = linha["throughput"] / base["throughput"]
+            else:
+                linha["speedup"] = 0.0
+            linha["eficiencia"] = linha["speedup"] * base["cozinheiros"] / linha["cozinheiros"]
+            linha["ganho_por_cozinheiro"] = _ganho_por_cozinheiro(anterior, linha)
+            anterior = linha
+
+def _ganho_por_cozinheiro(anterior, atual):
+    """
+    Ganho relativo de throughput dividido pelos cozinheiros acrescentados:
+    na grade 2 → 4, um ganho de 30% vale 15% por cozinheiro
+    """
+    if anterior is None or not anterior["throughput"]:
+        return None
+    acrescentados = atual["cozinheiros"] - anterior["cozinheiros"]
+    return (atual["throughput"] / anterior["throughput"] - 1) / acrescentados
+
+def encontrar_joelho(pontos, ganho_minimo):
+    """
+    Último número de cozinheiros que ainda compensa: o passo seguinte da
+    grade rende menos que `ganho_minimo` (fração) por cozinheiro acrescentado.
+    """
+    for anterior, atual in zip(pontos, pontos[1:]):
+        ganho = atual["ganho_por_cozinheiro"]
+        if ganho is not None and ganho < ganho_minimo:
+            return anterior["cozinheiros"]
+    return pontos[-1]["cozinheiros"]
+
+def _descrever(chave):
+    return ", ".join(f"{nome}={valor}" for nome, valor in zip(CHAVES_CURVA, chave))
+
+# ==================== SAÍDAS ====================
+
+def salvar_csv(caminho, linhas):
+    colunas = list(linhas[0].keys())
+    with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=colunas)
+        escritor.writeheader()
+        escritor.writerows(linhas)
+
+def imprimir_tabela(linhas):
+    print(f"{'coz':>4} {'pedidos':>7} {'t.base':>6} {'carga':<10} {'política':<10} "
+          f"{'pedidos/s':>9} {'speedup':>7} {'efic.':>6} {'ganho/coz':>9} {'lat.méd':>8} {'acerto':>7}")
+    for linha in linhas:
+        ganho = linha["ganho_por_cozinheiro"]
+        ganho = f"{ganho:+.0%}" if ganho is not None else "-"
+        print(f"{linha['cozinheiros']:>4} {linha['pedidos']:>7} {linha['tempo_base']:>6} "
+              f"{linha['carga']:<10} {linha['politica']:<10} {linha['throughput']:>9.2f} "
+              f"{linha['speedup']:>7.2f} {linha['eficiencia']:>6.0%} {ganho:>9} "
+              f"{linha['latencia_media']:>7.2f}s {linha['taxa_acerto_estacao']:>7.0%}")
+
+def salvar_graficos(diretorio, curvas):
+    """Gráficos de throughput e eficiência por número de cozinheiros"""
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("⚠️ matplotlib não instalado; gráficos não gerados (pip install matplotlib)")
+        return []
+
+    os.makedirs(diretorio, exist_ok=True)
+    arquivos = []
+    for metrica, titulo, arquivo in (
+            ("throughput", "Throughput (pedidos/s)", "escalabilidade.png"),
+            ("eficiencia", "Eficiência (speedup / cozinheiros)", "eficiencia.png")):
+        figura, eixo = plt.subplots(figsize=(8, 5))
+        for chave, pontos in curvas.items():
+            eixo.plot([p["cozinheiros"] for p in pontos], [p[metrica] for p in pontos],
+                      marker="o", label=_descrever(chave))
+        eixo.set_xlabel("Cozinheiros")
+        eixo.set_ylabel(titulo)
+        eixo.grid(True, alpha=0.3)
+        eixo.legend(fontsize=7)
+        caminho = os.path.join(diretorio, arquivo)
+        figura.tight_layout()
+        figura.savefig(caminho, dpi=120)
+        plt.close(figura)
+        arquivos.append(caminho)
+    return arquivos
+
+# ==================== PROGRAMA PRINCIPAL ====================
+
+def main():
+    parser = argparse.ArgumentParser(description="Varredura de parâmetros da cozinha concorrente")
+    parser.add_argument("--cozinheiros", type=int, nargs="+", default=[1, 2, 4, 6, 8])
+    parser.add_argument("--pedidos", type=int, nargs="+", default=[24])
+    parser.add_argument("--tempo-base", type=float, nargs="+", default=[0.1])
+    parser.add_argument("--carga", nargs="+", choices=TaskManager.TIPOS_CARGA, default=["aleatoria"])
+    parser.add_argument("--politica", nargs="+", choices=sorted(POLITICAS_SELECAO), default=["fifo"])
+    parser.add_argument("--lote-maximo", type=int, default=4)
+    parser.add_argument("--fator-preparo", type=float, default=0.5)
+    parser.add_argument("--fator-especialidade", type=float, default=1.0)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--processos", type=int, default=os.cpu_count() or 1,
+                        help="execuções simultâneas (1 = tudo em sequência)")
+    parser.add_argument("--ganho-minimo", type=float, default=0.10,
+                        help="ganho mínimo de throughput por cozinheiro acrescentado "
+                             "(passos maiores da grade são divididos pelo número de cozinheiros)")
+    parser.add_argument("--saida", default=os.path.join(DIRETORIO, "varredura.csv"))
+    parser.add_argument("--graficos", default=os.path.join(DIRETORIO, "graficos"))
+    args = parser.parse_args()
+
+    combinacoes = gerar_combinacoes(args)
+    print(f"🔬 {len(combinacoes)} combinações em {args.processos} processo(s)...")
+    linhas = executar_varredura(combinacoes, args.processos)
+
+    curvas = agrupar_curvas(linhas)
+    calcular_escalabilidade(curvas)
+    linhas = [linha for pontos in curvas.values() for linha in pontos]
+
+    imprimir_tabela(linhas)
+    salvar_csv(args.saida, linhas)
+    print(f"\n📄 Tabela gravada em {args.saida}")
+    for arquivo in salvar_graficos(args.graficos, curvas):
+        print(f"📈 Gráfico gravado em {arquivo}")
+
+    print(f"\n🎯 Onde mais cozinheiros deixam de compensar "
+          f"(ganho < {args.ganho_minimo:.0%} por cozinheiro acrescentado):")
+    for chave, pontos in curvas.items():
+        joelho = encontrar_joelho(pontos, args.ganho_minimo)
+        melhor = next(p for p in pontos if p["cozinheiros"] == joelho)
+        print(f"  • {_descrever(chave)}: {joelho} cozinheiro(s) "
+              f"({melhor['throughput']:.2f} pedidos/s, eficiência {melhor['eficiencia']:.0%})")
+
+if __name__ == "__main__":
+    main()
@@ -19,11 +19,20 @@ class Worker(QRunnable):
     Worker que executa tarefas em background sem bloquear a UI
     """
     
-    def __init__(self, id_cozinheiro, nome_tarefa, tempo_base=2.0):
+    def __init__(self, id_cozinheiro, nome_tarefa, tempo_base=2.0,
+                 variacao=(0.5, 1.5), passos=100, tarefas=None, tempo_preparo=0.0,
+                 fator_tempo=1.0):
         super().__init__()
         self.id_cozinheiro = id_cozinheiro
         self.nome_tarefa = nome_tarefa
         self.tempo_base = tempo_base
+        self.variacao = variacao
+        self.passos = passos
+        # Um lote tem vários pedidos do mesmo prato e paga o preparo uma vez só
+        self.tarefas = tarefas or [nome_tarefa]
+        self.tempo_preparo = tempo_preparo
+        # < 1 quando o prato é especialidade do cozinheiro
+        self.fator_tempo = fator_tempo
         self.sinais = WorkerSignals()
 
     @Slot()
@@ -33,12 +42,14 @@ class Worker(QRunnable):
         self.sinais.iniciado.emit(self.nome_tarefa)
         
         # Simula trabalho com tempo mais realista
-        tempo_total = self.tempo_base + random.uniform(0.5, 1.5)
-        passos = 100
+        tempo_total = self.tempo_preparo + self.fator_tempo * sum(
+            self.tempo_base + random.uniform(*self.variacao) for _ in self.tarefas
+        )
+        passos = self.passos
         
         for i in range(passos + 1):
             time.sleep(tempo_total / passos)
-            self.sinais.progresso.emit(i)
+            self.sinais.progresso.emit(i * 100 // passos)
         
         tempo_decorrido = time.time() - inicio
         self.sinais.tempo_decorrido.emit(tempo_decorrido)
@@ -60,6 +71,27 @@ class TaskManager:
         "🍤 Camarão"
     ]
     
+    # Tempo de preparo/troca da estação (s) ao começar um prato
+    TEMPO_PREPARO = {
+        "🍝 Spaghetti Carbonara": 0.6,
+        "🍕 Pizza Margherita": 1.0,
+        "🥘 Risotto": 0.8,
+        "🍖 Bife Grelhado": 0.5,
+        "🐟 Salmão Grelhado": 0.5,
+        "🍲 Ensopado": 0.9,
+        "🥗 Salada Caesar": 0.3,
+        "🍜 Ramen": 0.7,
+        "🧀 Lasanha": 1.0,
+        "🍤 Camarão": 0.4
+    }
+    
+    # Especialidades, distribuídas em rodízio pelos cozinheiros (id % 3)
+    ESPECIALIDADES = [
+        ("🍝 Spaghetti Carbonara", "🧀 Lasanha", "🥘 Risotto"),
+        ("🍖 Bife Grelhado", "🐟 Salmão Grelhado", "🍤 Camarão"),
+        ("🥗 Salada Caesar", "🍜 Ramen", "🍲 Ensopado", "🍕 Pizza Margherita")
+    ]
+    
     @staticmethod
     def gerar_nome_tarefa(numero_mesa):
         """Gera um nome de tarefa realista"""
@@ -67,9 +99,49 @@ class TaskManager:
         return f"Mesa {numero_mesa:02d}: {prato}"
     
     @staticmethod
-    def gerar_lista_tarefas(num_pedidos):
+    def extrair_prato(nome_tarefa):
+        """Extrai o prato de um nome no formato 'Mesa 01: prato'"""
+        return nome_tarefa.split(": ", 1)[-1]
+    
+    @staticmethod
+    def tempo_preparo(prato):
+        """Tempo de preparo da estação para o prato"""
+        return TaskManager.TEMPO_PREPARO.get(prato, 0.5)
+    
+    @staticmethod
+    def especialidades(id_cozinheiro):
+        """Pratos em que o cozinheiro é especialista"""
+        return TaskManager.ESPECIALIDADES[id_cozinheiro % len(TaskManager.ESPECIALIDADES)]
+    
+    @staticmethod
+    def gerar_lista_tarefas(num_pedidos, primeira_mesa=1):
         """Gera uma lista de tarefas para a fila"""
         return [
-            TaskManager.gerar_nome_tarefa(i + 1) 
+            TaskManager.gerar_nome_tarefa(primeira_mesa + i) 
             for i in range(num_pedidos)
-        ]
\ No newline at end of file
+        ]
+    
+    # Tipos de carga para experimentos (ver varredura.py)
+    TIPOS_CARGA = ("aleatoria", "repetitiva", "agrupada")
+    
+    @staticmethod
+    def gerar_carga(num_pedidos, tipo="aleatoria"):
+        """
+        Gera pedidos com um perfil de pratos:
+        aleatoria = qualquer prato; repetitiva = só 3 pratos;
+        agrupada = sequências de 4 pedidos iguais
+        """
+        if tipo == "aleatoria":
+            return TaskManager.gerar_lista_tarefas(num_pedidos)
+        
+        if tipo == "repetitiva":
+            pratos = random.sample(TaskManager.PRATOS_DISPONIVEIS, 3)
+            escolher = lambda i: random.choice(pratos)
+        elif tipo == "agrupada":
+            sequencia = [random.choice(TaskManager.PRATOS_DISPONIVEIS)
+                         for _ in range(num_pedidos // 4 + 1)]
+            escolher = lambda i: sequencia[i // 4]
+        else:
+            raise ValueError(f"Tipo de carga desconhecido: {tipo}")
+        
+        return [f"Mesa {i + 1:02d}: {escolher(i)}" for i in range(num_pedidos)]
\ No newline at end of file